@@ -3,7 +3,7 @@ from datetime import datetime
 
 from core.anomaly_detector import AnomalyDetector
 from utils.alerting import AlertManager
-from database.models import DatabaseManager
+from database.models import get_manager
 from utils.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -16,7 +16,7 @@ class AnomalyAgent:
         db_path: str = "data/evaluations.db",
         alert_channels: Optional[List[str]] = None
     ):
-        self.db_manager = DatabaseManager(db_path)
+        self.db_manager = get_manager(db_path)
         
         self.detector = AnomalyDetector(self.db_manager)
         
@@ -58,10 +58,11 @@ class AnomalyAgent:
                 if alert_sent:
                     self.stats['alerts_sent'] += 1
                 
-                for agent_check in check_results.get('agents_checked', []):
-                    if agent_check.get('anomaly_detected'):
-                        details = agent_check.get('details', {})
-                        self.alert_manager.send_anomaly_alert(details)
+                self.alert_manager.send_anomaly_alerts([
+                    agent_check.get('details', {})
+                    for agent_check in check_results.get('agents_checked', [])
+                    if agent_check.get('anomaly_detected')
+                ])
         else:
             logger.info("✅ No anomalies detected - all metrics are healthy")
         
@@ -71,10 +71,14 @@ class CollectorAgent:
         collected_data = []
         
         try:
-            for symbol in coins:
+            # Requests overlap inside DataCollector.fetch_coins; results are
+            # handled here in config order, so stats and saved files keep it
+            fetched = list(zip(coins, self.collector.fetch_coins(coins)))
+            
+            for symbol, (data, error) in fetched:
                 try:
-                    logger.info(f"Collecting data for {symbol}...")
-                    data = self.collector.collect_coin_data(symbol)
+                    if error is not None:
+                        raise error
                     
                     if data:
                         collected_data.append(data)
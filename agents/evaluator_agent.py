@@ -3,21 +3,25 @@ from pathlib import Path
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 import uuid
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 from core.data_evaluator import DataEvaluator
-from database.models import DatabaseManager, Evaluation
+from database.models import get_manager
 from config.settings import RAW_DATA_DIR, CLEANED_DATA_DIR, LABELED_DATA_DIR
 from utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+_FLUSH_SIZE = 1000  # Buffered evaluations written per bulk insert
+
 
 class EvaluatorAgent:
     
     def __init__(self, db_path: str = "data/evaluations.db"):
         self.evaluator = DataEvaluator()
         
-        self.db_manager = DatabaseManager(db_path)
+        self.db_manager = get_manager(db_path)
         
         self.stats = {
             'evaluations_performed': 0,
@@ -26,6 +30,12 @@ class EvaluatorAgent:
         }
         
         self.current_run_id = None
+        
+        self._pending_evaluations = None  # Set to a list while a batch run buffers writes
+        
+        # Guards stats and the pending buffer across stage threads; evaluation
+        # and database writes happen outside it
+        self._lock = threading.Lock()
     
     def start_pipeline_run(self) -> str:
         self.current_run_id = f"run_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
@@ -50,14 +60,12 @@ class EvaluatorAgent:
                 file_path=file_path
             )
             
-            self.stats['evaluations_performed'] += 1
-            self.stats['evaluations_saved'] += 1
-            
             return evaluation_result
             
         except Exception as e:
             logger.error(f"Error evaluating collector data: {e}", exc_info=True)
-            self.stats['evaluations_failed'] += 1
+            with self._lock:
+                self.stats['evaluations_failed'] += 1
             return {}
     
     def evaluate_cleaner_output(
@@ -78,14 +86,12 @@ class EvaluatorAgent:
                 file_path=file_path
             )
             
-            self.stats['evaluations_performed'] += 1
-            self.stats['evaluations_saved'] += 1
-            
             return evaluation_result
             
         except Exception as e:
             logger.error(f"Error evaluating cleaner data: {e}", exc_info=True)
-            self.stats['evaluations_failed'] += 1
+            with self._lock:
+                self.stats['evaluations_failed'] += 1
             return {}
     
     def evaluate_labeler_output(
@@ -106,86 +112,74 @@ class EvaluatorAgent:
                 file_path=file_path
             )
             
-            self.stats['evaluations_performed'] += 1
-            self.stats['evaluations_saved'] += 1
-            
             return evaluation_result
             
         except Exception as e:
             logger.error(f"Error evaluating labeler data: {e}", exc_info=True)
-            self.stats['evaluations_failed'] += 1
+            with self._lock:
+                self.stats['evaluations_failed'] += 1
             return {}
     
     def evaluate_all_pipeline_outputs(self) -> Dict[str, Any]:
         logger.info("Starting evaluation of all pipeline outputs")
         
         run_id = self.start_pipeline_run()
+        self._pending_evaluations = []
         
-        results = {
-            'run_id': run_id,
-            'collector_evaluations': [],
-            'cleaner_evaluations': [],
-            'labeler_evaluations': []
-        }
-        
-        raw_files = list(RAW_DATA_DIR.glob("*.json"))
-        raw_files = [f for f in raw_files if not f.name.startswith("all_coins")]
+        try:
+            results = self._evaluate_pipeline_files(run_id)
+        finally:
+            self._flush_evaluations()
+            self._pending_evaluations = None
         
-        logger.info(f"Found {len(raw_files)} raw data files to evaluate")
+        logger.info("Completed evaluation of all pipeline outputs")
+        self._log_summary()
         
-        for file_path in raw_files:
-            try:
-                with open(file_path, 'r') as f:
-                    data = json.load(f)
-                
-                eval_result = self.evaluate_collector_output(data, str(file_path))
-                
-                if eval_result:
-                    results['collector_evaluations'].append(eval_result)
-                    
-            except Exception as e:
-                logger.error(f"Error evaluating {file_path}: {e}")
+        return results
+    
+    def _evaluate_pipeline_files(self, run_id: str) -> Dict[str, Any]:
+        results = {'run_id': run_id}
         
-        cleaned_files = list(CLEANED_DATA_DIR.glob("*.json"))
-        cleaned_files = [f for f in cleaned_files if not f.name.startswith("all_coins")]
+        # The three stages read different directories and don't depend on
+        # each other, so they run side by side; only the stats and buffer
+        # updates are serialized under self._lock.
+        stages = [
+            ('raw', RAW_DATA_DIR, self.evaluate_collector_output, 'collector_evaluations'),
+            ('cleaned', CLEANED_DATA_DIR, self.evaluate_cleaner_output, 'cleaner_evaluations'),
+            ('labeled', LABELED_DATA_DIR, self.evaluate_labeler_output, 'labeler_evaluations'),
+        ]
         
-        logger.info(f"Found {len(cleaned_files)} cleaned data files to evaluate")
+        with ThreadPoolExecutor(max_workers=len(stages)) as executor:
+            futures = {
+                executor.submit(self._evaluate_stage_files, label, data_dir, evaluate): result_key
+                for label, data_dir, evaluate, result_key in stages
+            }
+            for future, result_key in futures.items():
+                results[result_key] = future.result()
         
-        for file_path in cleaned_files:
-            try:
-                with open(file_path, 'r') as f:
-                    data = json.load(f)
-                
-                eval_result = self.evaluate_cleaner_output(data, str(file_path))
-                
-                if eval_result:
-                    results['cleaner_evaluations'].append(eval_result)
-                    
-            except Exception as e:
-                logger.error(f"Error evaluating {file_path}: {e}")
+        return results
+    
+    def _evaluate_stage_files(self, label: str, data_dir: Path, evaluate) -> List[Dict[str, Any]]:
+        evaluations = []
         
-        labeled_files = list(LABELED_DATA_DIR.glob("*.json"))
-        labeled_files = [f for f in labeled_files if not f.name.startswith("all_coins")]
+        files = [f for f in data_dir.glob("*.json") if not f.name.startswith("all_coins")]
         
-        logger.info(f"Found {len(labeled_files)} labeled data files to evaluate")
+        logger.info(f"Found {len(files)} {label} data files to evaluate")
         
-        for file_path in labeled_files:
+        for file_path in files:
             try:
                 with open(file_path, 'r') as f:
                     data = json.load(f)
                 
-                eval_result = self.evaluate_labeler_output(data, str(file_path))
+                eval_result = evaluate(data, str(file_path))
                 
                 if eval_result:
-                    results['labeler_evaluations'].append(eval_result)
+                    evaluations.append(eval_result)
                     
             except Exception as e:
                 logger.error(f"Error evaluating {file_path}: {e}")
         
-        logger.info("Completed evaluation of all pipeline outputs")
-        self._log_summary()
-        
-        return results
+        return evaluations
     
     def _save_evaluation(
         self,
@@ -194,34 +188,72 @@ class EvaluatorAgent:
         evaluation_result: Dict[str, Any],
         file_path: Optional[str] = None
     ):
-        session = self.db_manager.get_session()
-        try:
-            eval_record = Evaluation(
-                agent_type=agent_type,
-                symbol=symbol,
-                completeness_score=evaluation_result.get('completeness_score'),
-                accuracy_score=evaluation_result.get('accuracy_score'),
-                consistency_score=evaluation_result.get('consistency_score'),
-                overall_score=evaluation_result.get('overall_score'),
-                metrics_json=evaluation_result.get('metrics_json', '{}'),
-                evaluated_fields=json.dumps(evaluation_result.get('evaluated_fields', [])),
-                issues_found=json.dumps(evaluation_result.get('issues_found', [])),
-                recommendations=json.dumps(evaluation_result.get('recommendations', [])),
-                pipeline_run_id=self.current_run_id,
-                data_file_path=file_path
-            )
-            
-            session.add(eval_record)
-            
-            session.commit()
+        row = {
+            'agent_type': agent_type,
+            'symbol': symbol,
+            'completeness_score': evaluation_result.get('completeness_score'),
+            'accuracy_score': evaluation_result.get('accuracy_score'),
+            'consistency_score': evaluation_result.get('consistency_score'),
+            'overall_score': evaluation_result.get('overall_score'),
+            'metrics_json': evaluation_result.get('metrics_json', '{}'),
+            'evaluated_fields': json.dumps(evaluation_result.get('evaluated_fields', [])),
+            'issues_found': json.dumps(evaluation_result.get('issues_found', [])),
+            'recommendations': json.dumps(evaluation_result.get('recommendations', [])),
+            'pipeline_run_id': self.current_run_id,
+            'data_file_path': file_path,
+            'evaluation_timestamp': datetime.now()
+        }
+        
+        with self._lock:
+            self.stats['evaluations_performed'] += 1
             
+            if self._pending_evaluations is None:
+                rows = [row]
+            else:
+                self._pending_evaluations.append(row)
+                if len(self._pending_evaluations) < _FLUSH_SIZE:
+                    return
+                rows = self._pending_evaluations
+                self._pending_evaluations = []
+        
+        if self._write_evaluations(rows) and len(rows) == 1:
             logger.debug(f"Saved evaluation for {agent_type} - {symbol}")
-            
+    
+    def _flush_evaluations(self):
+        with self._lock:
+            rows = self._pending_evaluations
+            if rows is not None:
+                self._pending_evaluations = []
+        
+        if rows:
+            self._write_evaluations(rows)
+    
+    def _write_evaluations(self, rows: List[Dict[str, Any]]) -> int:
+        # Rows only count as saved once they are in the database. If the bulk
+        # insert fails, retry row by row so one bad row doesn't cost the rest
+        # of the batch, and count whatever still fails.
+        saved = len(rows) if self._insert_evaluations(rows) else 0
+        
+        if not saved and len(rows) > 1:
+            logger.warning(f"Bulk insert of {len(rows)} evaluations failed, retrying row by row")
+            saved = sum(self._insert_evaluations([row]) for row in rows)
+        
+        with self._lock:
+            self.stats['evaluations_saved'] += saved
+            self.stats['evaluations_failed'] += len(rows) - saved
+        
+        if len(rows) > 1:
+            logger.debug(f"Saved {saved} of {len(rows)} buffered evaluations")
+        
+        return saved
+    
+    def _insert_evaluations(self, rows: List[Dict[str, Any]]) -> bool:
+        try:
+            self.db_manager.bulk_insert_evaluations(rows)
+            return True
         except Exception as e:
             logger.error(f"Error saving evaluation to database: {e}", exc_info=True)
-            session.rollback()
-        finally:
-            session.close()
+            return False
     
     def _log_summary(self):
         logger.info("=" * 50)
@@ -1,16 +1,23 @@
 
 from analytics.data_quality_reporter import DataQualityReporter
 
-try:
-    from analytics.evaluation_analyzer import EvaluationAnalyzer
-    from analytics.event_tracker import EventTracker
-    from analytics.metrics_calculator import MetricsCalculator
-    __all__ = [
-        "DataQualityReporter",
-        "EvaluationAnalyzer",
-        "EventTracker",
-        "MetricsCalculator"
-    ]
-except ImportError:
-    __all__ = ["DataQualityReporter"]
+# The database-backed classes pull in SQLAlchemy and pandas, so they are
+# imported on first attribute access rather than with the package
+_LAZY_EXPORTS = {
+    "EvaluationAnalyzer": "analytics.evaluation_analyzer",
+    "EventTracker": "analytics.event_tracker",
+    "MetricsCalculator": "analytics.metrics_calculator",
+}
 
+__all__ = ["DataQualityReporter", *_LAZY_EXPORTS]
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    from importlib import import_module
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -4,7 +4,7 @@ from pathlib import Path
 from datetime import datetime
 import json
 
-from core.data_standards import DataDictionary
+from core.data_standards import DataDictionary, get_data_dictionary
 from utils.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -13,7 +13,7 @@ logger = setup_logger(__name__)
 class DataQualityReporter:
     
     def __init__(self, dictionary: Optional[DataDictionary] = None):
-        self.dictionary = dictionary or DataDictionary()
+        self.dictionary = dictionary or get_data_dictionary()
         self.report_history = []
     
     def generate_report(
@@ -23,7 +23,9 @@ class DataQualityReporter:
     ) -> Dict[str, Any]:
         logger.info(f"Generating {report_type} quality report for {data.get('symbol', 'unknown')}")
         
-        validation_errors = self.dictionary.validate_data(data)
+        # Validators run once per field; the summary and field analysis share them
+        field_errors = self.dictionary.validate_fields(data)
+        validation_errors = self.dictionary.validate_data(data, field_errors)
         
         completeness = self._analyze_completeness(data)
         validity = self._analyze_validity(data, validation_errors)
@@ -48,7 +50,7 @@ class DataQualityReporter:
         }
         
         if report_type == "full":
-            report["field_analysis"] = self._analyze_fields(data)
+            report["field_analysis"] = self._analyze_fields(data, field_errors)
             report["validation_details"] = validation_errors
         
         self.report_history.append(report)
@@ -162,7 +164,11 @@ class DataQualityReporter:
             "grade": self._grade_score(consistency_pct)
         }
     
-    def _analyze_fields(self, data: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    def _analyze_fields(
+        self,
+        data: Dict[str, Any],
+        field_errors: Dict[str, List[str]]
+    ) -> Dict[str, Dict[str, Any]]:
         field_analysis = {}
         
         for field_name, field_def in self.dictionary.fields.items():
@@ -178,7 +184,7 @@ class DataQualityReporter:
             }
             
             if field_name in data:
-                errors = self.dictionary.validate_field(field_name, value)
+                errors = field_errors[field_name]
                 analysis["validation_errors"] = errors
                 analysis["is_valid"] = len(errors) == 0
             
@@ -287,6 +293,35 @@ class DataQualityReporter:
         logger.info(f"Saved quality report to {output_path}")
         return output_path
     
+    def save_reports(
+        self,
+        reports: List[Dict[str, Any]],
+        output_path: Optional[Path] = None,
+        format: str = "jsonl"
+    ) -> Path:
+        # Writes a whole batch of reports to one file: one JSON report per
+        # line, or the Markdown reports separated by horizontal rules
+        from config.settings import QUALITY_REPORTS_DIR
+        
+        if not output_path:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"quality_reports_{timestamp}.{format}"
+            output_path = QUALITY_REPORTS_DIR / filename
+        
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        if format == "jsonl":
+            with open(output_path, "w") as f:
+                f.writelines(json.dumps(report) + "\n" for report in reports)
+        elif format == "markdown":
+            with open(output_path, "w") as f:
+                f.write("\n\n---\n\n".join(self._report_to_markdown(report) for report in reports))
+        else:
+            raise ValueError(f"Unsupported format: {format}")
+        
+        logger.info(f"Saved {len(reports)} quality reports to {output_path}")
+        return output_path
+    
     def _report_to_markdown(self, report: Dict[str, Any]) -> str:
         lines = [
             "# Data Quality Report",
@@ -366,16 +401,37 @@ class DataQualityReporter:
         
         return "\n".join(lines)
     
+    @staticmethod
+    def _to_summary(report: Dict[str, Any]) -> Dict[str, Any]:
+        summary = {
+            key: value for key, value in report.items()
+            if key not in ("field_analysis", "validation_details")
+        }
+        summary["report_metadata"] = {**report["report_metadata"], "report_type": "summary"}
+        return summary
+    
     def generate_batch_report(
         self,
-        data_list: List[Dict[str, Any]]
+        data_list: List[Dict[str, Any]],
+        reports: Optional[List[Dict[str, Any]]] = None
     ) -> Dict[str, Any]:
-        reports = [self.generate_report(data, report_type="summary") for data in data_list]
+        if reports is None:
+            reports = [self.generate_report(data, report_type="summary") for data in data_list]
+        else:
+            # Reports the caller already built for data_list; trim to summary
+            # shape instead of re-validating every record
+            reports = [self._to_summary(r) for r in reports]
+        
+        completeness_total = validity_total = consistency_total = 0.0
+        for r in reports:
+            completeness_total += r["completeness"]["required_completeness_percentage"]
+            validity_total += r["validity"]["validity_percentage"]
+            consistency_total += r["consistency"]["consistency_percentage"]
         
         avg_scores = {
-            "completeness": sum(r["completeness"]["required_completeness_percentage"] for r in reports) / len(reports),
-            "validity": sum(r["validity"]["validity_percentage"] for r in reports) / len(reports),
-            "consistency": sum(r["consistency"]["consistency_percentage"] for r in reports) / len(reports)
+            "completeness": completeness_total / len(reports),
+            "validity": validity_total / len(reports),
+            "consistency": consistency_total / len(reports)
         }
         
         overall_avg = (
@@ -1,7 +1,7 @@
 
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
-from database.models import DatabaseManager
+from database.models import get_manager
 from database.queries import EvaluationQueries
 from utils.logger import setup_logger
 
@@ -11,7 +11,7 @@ logger = setup_logger(__name__)
 class EvaluationAnalyzer:
     
     def __init__(self, db_path: str = "data/evaluations.db"):
-        self.db_manager = DatabaseManager(db_path)
+        self.db_manager = get_manager(db_path)
         self.queries = EvaluationQueries(self.db_manager)
     
     def generate_quality_report(
@@ -19,6 +19,14 @@ class EvaluationAnalyzer:
         agent_type: Optional[str] = None, 
         days: int = 7
     ) -> Dict[str, Any]:
+        # Served from the query-result cache for up to its TTL, or until
+        # evaluations are written through the shared DatabaseManager
+        return self.queries.cached_result(
+            ('quality_report', agent_type, days),
+            lambda: self._build_quality_report(agent_type, days)
+        )
+    
+    def _build_quality_report(self, agent_type: Optional[str], days: int) -> Dict[str, Any]:
         logger.info(f"Generating quality report for {agent_type or 'all agents'} (last {days} days)")
         
         report = {
@@ -31,14 +39,19 @@ class EvaluationAnalyzer:
             'recommendations': []  # Actionable recommendations
         }
         
-        avg_scores = self.queries.get_avg_scores_by_agent(days)
+        # One connection for the summary numbers and trends
+        snapshot = self.queries.dashboard_snapshot(
+            agent_type, days, trend_agent_types=['collector', 'cleaner', 'labeler']
+        )
+        
+        avg_scores = snapshot['avg']
         
         if agent_type:
             avg_scores = [s for s in avg_scores if s['agent_type'] == agent_type]
         
         report['summary']['average_scores'] = avg_scores
         
-        distribution = self.queries.get_quality_distribution(agent_type)
+        distribution = snapshot['dist']
         report['summary']['quality_distribution'] = distribution
         
         total = distribution['total']
@@ -50,14 +63,9 @@ class EvaluationAnalyzer:
             }
         
         if agent_type:
-            trends = self.queries.get_trend_over_time(agent_type, days)
-            report['trends'] = trends
+            report['trends'] = snapshot['trend'][agent_type]
         else:
-            agent_types = ['collector', 'cleaner', 'labeler']
-            report['trends'] = {
-                agent: self.queries.get_trend_over_time(agent, days)
-                for agent in agent_types
-            }
+            report['trends'] = snapshot['trend']
         
         top_issues = self.queries.get_top_issues(agent_type, limit=10)
         report['issues']['top_issues'] = top_issues
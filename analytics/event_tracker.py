@@ -4,7 +4,7 @@ from datetime import datetime, date
 from typing import Dict, Any, Optional
 import json
 from sqlalchemy import text
-from database.models import DatabaseManager
+from database.models import get_manager
 from utils.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -13,7 +13,7 @@ logger = setup_logger(__name__)
 class EventTracker:
     
     def __init__(self, db_path: str = "data/analytics.db"):
-        self.db_manager = DatabaseManager(db_path)
+        self.db_manager = get_manager(db_path)
         self._ensure_tables_exist()
     
     def _ensure_tables_exist(self):
@@ -1,17 +1,67 @@
 
 from datetime import datetime, date, timedelta
 from typing import Dict, List, Any, Optional
-from sqlalchemy import text
-from database.models import DatabaseManager
+from sqlalchemy import text, bindparam
+from database.models import get_manager
 from utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
 
+PIPELINE_STEPS = [
+    'pipeline_start', 'collection_complete', 'cleaning_complete',
+    'labeling_complete', 'evaluation_complete'
+]
+
+# Step pairs reported as conversion rates on the analytics dashboard
+DASHBOARD_CONVERSIONS = [
+    ('pipeline_start', 'evaluation_complete'),
+    ('collection_complete', 'cleaning_complete'),
+    ('cleaning_complete', 'labeling_complete'),
+    ('labeling_complete', 'evaluation_complete')
+]
+
+# Distinct sessions per event name, for every requested event in one
+# grouped scan; funnels and conversion rates are derived from these counts
+_EVENT_COUNTS_FROM = """
+    SELECT event_name, COUNT(DISTINCT session_id) AS count
+    FROM analytics_events
+    WHERE event_name IN :events
+"""
+_EVENT_COUNTS_SQL = text(
+    _EVENT_COUNTS_FROM + " GROUP BY event_name"
+).bindparams(bindparam('events', expanding=True))
+_EVENT_COUNTS_IN_RANGE_SQL = text(
+    _EVENT_COUNTS_FROM + " AND DATE(timestamp) BETWEEN :start_date AND :end_date GROUP BY event_name"
+).bindparams(bindparam('events', expanding=True))
+
+_FEATURE_USAGE_SQL = text("""
+    SELECT
+        COUNT(*) AS total,
+        COUNT(*) FILTER (WHERE status = 'completed') AS completed,
+        AVG(JULIANDAY(completed_at) - JULIANDAY(started_at))
+            FILTER (WHERE status = 'completed' AND completed_at IS NOT NULL) * 24 AS avg_hours
+    FROM analytics_sessions
+    WHERE DATE(started_at) BETWEEN :start_date AND :end_date
+""")
+
+# Returning cohort users per requested day. The cohort day itself is in
+# :days, and its count is the cohort size.
+_RETENTION_SQL = text("""
+    SELECT DATE(started_at) AS day, COUNT(DISTINCT user_id) AS count
+    FROM analytics_sessions
+    WHERE user_id IN (
+        SELECT user_id FROM analytics_sessions WHERE DATE(started_at) = :cohort_date
+    )
+    AND DATE(started_at) IN :days
+    GROUP BY DATE(started_at)
+""").bindparams(bindparam('days', expanding=True))
+
+
 class MetricsCalculator:
     
     def __init__(self, db_path: str = "data/analytics.db"):
-        self.db_manager = DatabaseManager(db_path)
+        self.db_manager = get_manager(db_path)
     
     def calculate_dau(self, target_date: Optional[date] = None) -> int:
         if not target_date:
@@ -48,17 +98,7 @@ class MetricsCalculator:
         start_date = date.today() - timedelta(days=days)
         session = self.db_manager.get_session()
         try:
-            result = session.execute(
-                text("""
-                    SELECT DATE(started_at) as date, COUNT(DISTINCT session_id) as dau
-                    FROM analytics_sessions
-                    WHERE DATE(started_at) >= :start_date
-                    GROUP BY DATE(started_at)
-                    ORDER BY DATE(started_at)
-                """),
-                {'start_date': start_date}
-            )
-            return [{'date': str(row.date), 'dau': row.dau} for row in result.fetchall()]
+            return self._fetch_dau_timeseries(session, start_date)
         finally:
             session.close()
     
@@ -84,41 +124,11 @@ class MetricsCalculator:
         """
         session = self.db_manager.get_session()
         try:
-            query_params = {}
-            date_filter = ""
-            if date_range:
-                date_filter = " AND DATE(timestamp) BETWEEN :start_date AND :end_date"
-                query_params['start_date'] = date_range[0]
-                query_params['end_date'] = date_range[1]
-            
-            # Count users who started
-            start_result = session.execute(
-                text(f"""
-                    SELECT COUNT(DISTINCT session_id) as count
-                    FROM analytics_events
-                    WHERE event_name = :start_event{date_filter}
-                """),
-                {**query_params, 'start_event': start_event}
-            )
-            start_count = start_result.fetchone().count
-            
-            if start_count == 0:
-                return 0.0
-            
-            # Count users who completed
-            end_result = session.execute(
-                text(f"""
-                    SELECT COUNT(DISTINCT session_id) as count
-                    FROM analytics_events
-                    WHERE event_name = :end_event{date_filter}
-                """),
-                {**query_params, 'end_event': end_event}
-            )
-            end_count = end_result.fetchone().count
-            
-            return (end_count / start_count) * 100.0
+            counts = self._fetch_event_counts(session, [start_event, end_event], date_range)
         finally:
             session.close()
+        
+        return self._conversion_rate(counts, start_event, end_event)
     
     def calculate_funnel(self, steps: List[str], 
                         date_range: Optional[tuple] = None) -> Dict[str, Any]:
@@ -141,43 +151,11 @@ class MetricsCalculator:
         """
         session = self.db_manager.get_session()
         try:
-            query_params = {}
-            date_filter = ""
-            if date_range:
-                date_filter = " AND DATE(timestamp) BETWEEN :start_date AND :end_date"
-                query_params['start_date'] = date_range[0]
-                query_params['end_date'] = date_range[1]
-            
-            funnel_data = {}
-            previous_count = None
-            
-            for step in steps:
-                result = session.execute(
-                    text(f"""
-                        SELECT COUNT(DISTINCT session_id) as count
-                        FROM analytics_events
-                        WHERE event_name = :step{date_filter}
-                    """),
-                    {**query_params, 'step': step}
-                )
-                count = result.fetchone().count
-                
-                drop_off = None
-                conversion_rate = None
-                if previous_count is not None and previous_count > 0:
-                    drop_off = ((previous_count - count) / previous_count) * 100.0
-                    conversion_rate = (count / previous_count) * 100.0
-                
-                funnel_data[step] = {
-                    'count': count,
-                    'drop_off': drop_off,
-                    'conversion_rate': conversion_rate
-                }
-                previous_count = count
-            
-            return funnel_data
+            counts = self._fetch_event_counts(session, steps, date_range)
         finally:
             session.close()
+        
+        return self._funnel_from_counts(steps, counts)
     
     def calculate_retention(self, cohort_date: date, days: List[int]) -> Dict[int, float]:
         """Calculate retention rates for a cohort.
@@ -202,39 +180,7 @@ class MetricsCalculator:
         """
         session = self.db_manager.get_session()
         try:
-            # Get cohort users
-            cohort_result = session.execute(
-                text("""
-                    SELECT DISTINCT user_id
-                    FROM analytics_sessions
-                    WHERE DATE(started_at) = :cohort_date
-                """),
-                {'cohort_date': cohort_date}
-            )
-            cohort_users = [row.user_id for row in cohort_result.fetchall()]
-            
-            if not cohort_users:
-                return {d: 0.0 for d in days}
-            
-            # Calculate retention for each day
-            retention = {}
-            placeholders = ','.join(['?' for _ in cohort_users])
-            
-            for day in days:
-                retention_date = cohort_date + timedelta(days=day)
-                result = session.execute(
-                    text(f"""
-                        SELECT COUNT(DISTINCT user_id) as count
-                        FROM analytics_sessions
-                        WHERE user_id IN ({placeholders})
-                        AND DATE(started_at) = ?
-                    """),
-                    [*cohort_users, retention_date]
-                )
-                returned_count = result.fetchone().count
-                retention[day] = (returned_count / len(cohort_users)) * 100.0
-            
-            return retention
+            return self._fetch_retention(session, cohort_date, days)
         finally:
             session.close()
     
@@ -257,11 +203,7 @@ class MetricsCalculator:
         """
         end_date = date.today()
         start_date = end_date - timedelta(days=days)
-        return self.calculate_funnel(
-            ['pipeline_start', 'collection_complete', 'cleaning_complete', 
-             'labeling_complete', 'evaluation_complete'],
-            (start_date, end_date)
-        )
+        return self.calculate_funnel(PIPELINE_STEPS, (start_date, end_date))
     
     def get_feature_usage(self, days: int = 30) -> Dict[str, Any]:
         """Get feature usage statistics.
@@ -282,52 +224,7 @@ class MetricsCalculator:
         start_date = end_date - timedelta(days=days)
         session = self.db_manager.get_session()
         try:
-            # Average completion time
-            avg_time_result = session.execute(
-                text("""
-                    SELECT 
-                        AVG(JULIANDAY(completed_at) - JULIANDAY(started_at)) * 24 as avg_hours
-                    FROM analytics_sessions
-                    WHERE status = 'completed'
-                    AND DATE(started_at) BETWEEN :start_date AND :end_date
-                    AND completed_at IS NOT NULL
-                """),
-                {'start_date': start_date, 'end_date': end_date}
-            )
-            avg_hours_row = avg_time_result.fetchone()
-            avg_hours = avg_hours_row.avg_hours if avg_hours_row and avg_hours_row.avg_hours else 0.0
-            
-            # Total sessions
-            total_result = session.execute(
-                text("""
-                    SELECT COUNT(*) as total
-                    FROM analytics_sessions
-                    WHERE DATE(started_at) BETWEEN :start_date AND :end_date
-                """),
-                {'start_date': start_date, 'end_date': end_date}
-            )
-            total = total_result.fetchone().total
-            
-            # Completed sessions
-            completed_result = session.execute(
-                text("""
-                    SELECT COUNT(*) as completed
-                    FROM analytics_sessions
-                    WHERE status = 'completed'
-                    AND DATE(started_at) BETWEEN :start_date AND :end_date
-                """),
-                {'start_date': start_date, 'end_date': end_date}
-            )
-            completed = completed_result.fetchone().completed
-            
-            completion_rate = (completed / total * 100.0) if total > 0 else 0.0
-            
-            return {
-                'avg_completion_hours': round(avg_hours, 2),
-                'total_sessions': total,
-                'completed_sessions': completed,
-                'completion_rate': round(completion_rate, 2)
-            }
+            return self._fetch_feature_usage(session, start_date, end_date)
         finally:
             session.close()
     
@@ -351,6 +248,156 @@ class MetricsCalculator:
             'feature_usage': self.get_feature_usage(days)
         }
     
+    def get_dashboard_bundle(
+        self,
+        days: int = 30,
+        timeseries_days: int = 7,
+        cohort_date: Optional[date] = None,
+        retention_days: Optional[List[int]] = None
+    ) -> Dict[str, Any]:
+        """Get every metric shown on the analytics dashboard in one call.
+        
+        INTERVIEW EXPLANATION:
+        The dashboard used to call eight methods, each opening a session
+        and running its own COUNT queries (one per funnel step, two per
+        conversion rate, one per retention day). Here one session runs
+        four grouped queries:
+        - Distinct sessions per event name for all pipeline steps, from
+          which the funnel and every conversion rate are derived
+        - DAU per day for the time series (today's DAU is its last point)
+        - Total/completed sessions and average completion time
+        - Returning cohort users for all retention days at once
+        
+        Args:
+            days: Window for conversion rates, funnel and feature usage
+            timeseries_days: Window for the DAU time series
+            cohort_date: Retention cohort date (default: 7 days ago)
+            retention_days: Days to calculate retention for (default: 1, 7, 30)
+        
+        Returns:
+            Dictionary with dau, dau_timeseries, conversion_rates,
+            pipeline_funnel, feature_usage and retention
+        """
+        end_date = date.today()
+        date_range = (end_date - timedelta(days=days), end_date)
+        if cohort_date is None:
+            cohort_date = end_date - timedelta(days=7)
+        if retention_days is None:
+            retention_days = [1, 7, 30]
+        
+        session = self.db_manager.get_session()
+        try:
+            counts = self._fetch_event_counts(session, PIPELINE_STEPS, date_range)
+            dau_timeseries = self._fetch_dau_timeseries(session, end_date - timedelta(days=timeseries_days))
+            feature_usage = self._fetch_feature_usage(session, *date_range)
+            retention = self._fetch_retention(session, cohort_date, retention_days)
+        finally:
+            session.close()
+        
+        today = str(end_date)
+        dau = next((day['dau'] for day in dau_timeseries if day['date'] == today), 0)
+        
+        return {
+            'dau': dau,
+            'dau_timeseries': dau_timeseries,
+            'conversion_rates': [
+                {
+                    'start_event': start_event,
+                    'end_event': end_event,
+                    'rate': self._conversion_rate(counts, start_event, end_event)
+                }
+                for start_event, end_event in DASHBOARD_CONVERSIONS
+            ],
+            'pipeline_funnel': self._funnel_from_counts(PIPELINE_STEPS, counts),
+            'feature_usage': feature_usage,
+            'cohort_date': cohort_date,
+            'retention': retention
+        }
+    
+    def _fetch_event_counts(self, session, events: List[str],
+                            date_range: Optional[tuple]) -> Dict[str, int]:
+        if date_range:
+            result = session.execute(
+                _EVENT_COUNTS_IN_RANGE_SQL,
+                {'events': list(events), 'start_date': date_range[0], 'end_date': date_range[1]}
+            )
+        else:
+            result = session.execute(_EVENT_COUNTS_SQL, {'events': list(events)})
+        return {row.event_name: row.count for row in result}
+    
+    def _conversion_rate(self, counts: Dict[str, int], start_event: str, end_event: str) -> float:
+        start_count = counts.get(start_event, 0)
+        if start_count == 0:
+            return 0.0
+        return (counts.get(end_event, 0) / start_count) * 100.0
+    
+    def _funnel_from_counts(self, steps: List[str], counts: Dict[str, int]) -> Dict[str, Any]:
+        funnel_data = {}
+        previous_count = None
+        
+        for step in steps:
+            count = counts.get(step, 0)
+            
+            drop_off = None
+            conversion_rate = None
+            if previous_count is not None and previous_count > 0:
+                drop_off = ((previous_count - count) / previous_count) * 100.0
+                conversion_rate = (count / previous_count) * 100.0
+            
+            funnel_data[step] = {
+                'count': count,
+                'drop_off': drop_off,
+                'conversion_rate': conversion_rate
+            }
+            previous_count = count
+        
+        return funnel_data
+    
+    def _fetch_dau_timeseries(self, session, start_date: date) -> List[Dict[str, Any]]:
+        result = session.execute(
+            text("""
+                SELECT DATE(started_at) as date, COUNT(DISTINCT session_id) as dau
+                FROM analytics_sessions
+                WHERE DATE(started_at) >= :start_date
+                GROUP BY DATE(started_at)
+                ORDER BY DATE(started_at)
+            """),
+            {'start_date': start_date}
+        )
+        return [{'date': str(row.date), 'dau': row.dau} for row in result.fetchall()]
+    
+    def _fetch_feature_usage(self, session, start_date: date, end_date: date) -> Dict[str, Any]:
+        row = session.execute(
+            _FEATURE_USAGE_SQL, {'start_date': start_date, 'end_date': end_date}
+        ).one()
+        
+        avg_hours = row.avg_hours or 0.0
+        completion_rate = (row.completed / row.total * 100.0) if row.total > 0 else 0.0
+        
+        return {
+            'avg_completion_hours': round(avg_hours, 2),
+            'total_sessions': row.total,
+            'completed_sessions': row.completed,
+            'completion_rate': round(completion_rate, 2)
+        }
+    
+    def _fetch_retention(self, session, cohort_date: date, days: List[int]) -> Dict[int, float]:
+        day_dates = {day: str(cohort_date + timedelta(days=day)) for day in days}
+        result = session.execute(
+            _RETENTION_SQL,
+            {'cohort_date': cohort_date, 'days': [str(cohort_date), *day_dates.values()]}
+        )
+        returned = {row.day: row.count for row in result}
+        
+        cohort_size = returned.get(str(cohort_date), 0)
+        if not cohort_size:
+            return {d: 0.0 for d in days}
+        
+        return {
+            day: (returned.get(day_date, 0) / cohort_size) * 100.0
+            for day, day_date in day_dates.items()
+        }
+    
     def close(self):
         """Close database connection."""
         self.db_manager.close()
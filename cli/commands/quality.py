@@ -4,7 +4,7 @@ from pathlib import Path
 import json
 
 from analytics.data_quality_reporter import DataQualityReporter
-from core.data_standards import DataDictionary
+from core.data_standards import get_data_dictionary
 from config.settings import RAW_DATA_DIR, CLEANED_DATA_DIR, LABELED_DATA_DIR, QUALITY_REPORTS_DIR
 from cli.utils import print_success, print_error, print_info, print_warning, format_output, load_json_file
 from utils.logger import setup_logger
@@ -143,7 +143,7 @@ def batch(data_dir, save, output_format):
 @click.option('--output-format', type=click.Choice(['table', 'json']), default='table', help='Output format')
 def standards(output_format):
     try:
-        dictionary = DataDictionary()
+        dictionary = get_data_dictionary()
         
         print("Data Standards & Dictionary")
         print("="*60)
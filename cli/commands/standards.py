@@ -3,7 +3,7 @@ import click
 from pathlib import Path
 import json
 
-from core.data_standards import DataDictionary
+from core.data_standards import get_data_dictionary
 from cli.utils import print_success, print_error, print_info, print_warning, format_output, save_json_file
 from utils.logger import setup_logger
 
@@ -19,7 +19,7 @@ def standards():
 @click.option('--output-format', type=click.Choice(['table', 'json']), default='table', help='Output format')
 def show(output_format):
     try:
-        dictionary = DataDictionary()
+        dictionary = get_data_dictionary()
         
         print("Data Dictionary & Standards")
         print("="*60)
@@ -58,7 +58,7 @@ def show(output_format):
 @click.option('--output-format', type=click.Choice(['table', 'json']), default='table', help='Output format')
 def field(field_name, output_format):
     try:
-        dictionary = DataDictionary()
+        dictionary = get_data_dictionary()
         
         if field_name not in dictionary.fields:
             print_error(f"Field '{field_name}' not found in dictionary")
@@ -98,7 +98,7 @@ def field(field_name, output_format):
 @click.option('--output-format', type=click.Choice(['table', 'json']), default='table', help='Output format')
 def export(output_file, output_format):
     try:
-        dictionary = DataDictionary()
+        dictionary = get_data_dictionary()
         
         if not output_file:
             output_file = Path("data_dictionary.json")
@@ -128,7 +128,7 @@ def export(output_file, output_format):
 def validate(filepath, output_format):
     try:
         import json
-        dictionary = DataDictionary()
+        dictionary = get_data_dictionary()
         
         with open(filepath, 'r') as f:
             data = json.load(f)
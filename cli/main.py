@@ -8,7 +8,7 @@ sys.path.insert(0, str(project_root))
 
 from cli.commands import collect, clean, label, evaluate, quality, analytics, anomaly, report, standards
 from cli.utils import print_info, print_success, print_error, print_warning
-from utils.logger import setup_logger
+from utils.logger import setup_logger, configure_logging
 
 logger = setup_logger(__name__)
 
@@ -16,7 +16,7 @@ logger = setup_logger(__name__)
 @click.group()
 @click.version_option(version='1.0.0')
 def cli():
-    pass
+    configure_logging()
 
 
 cli.add_command(collect.collect, name='collect')
@@ -31,13 +31,22 @@ cli.add_command(standards.standards, name='standards')
 
 
 @cli.command()
-def pipeline():
+@click.option('--phases', default=None,
+              help='Comma-separated phases to run: collect,clean,label,evaluate,anomaly (default: all)')
+def pipeline(phases):
+    from main import main as run_pipeline, parse_phases
+    
+    selected = None
+    if phases is not None:
+        try:
+            selected = parse_phases(phases)
+        except ValueError as e:
+            raise click.BadParameter(str(e), param_hint='--phases')
+    
     try:
         print_info("Starting complete pipeline...")
         
-        from main import main as run_pipeline
-        
-        exit_code = run_pipeline()
+        exit_code = run_pipeline(selected)
         sys.exit(exit_code)
         
     except KeyboardInterrupt:
@@ -147,6 +147,14 @@ class DataCleaner:
         self.cleaning_stats["duplicates_removed"] += duplicates_removed
         
         numeric_cols = df.select_dtypes(include=[np.number]).columns
+        
+        # Same rule as _detect_outliers, applied to the whole column at once
+        # and before the median fills below; NaN prices are left to dropna
+        if "price" in numeric_cols:
+            non_positive = df["price"].to_numpy() <= 0
+            self.cleaning_stats["outliers_removed"] += int(non_positive.sum())
+            df = df[~non_positive]
+        
         for col in numeric_cols:
             if col in ["price"]:  # Critical numeric fields
                 df = df.dropna(subset=[col])
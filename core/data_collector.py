@@ -1,7 +1,10 @@
 
 import time
+import threading
 import requests
-from typing import Dict, List, Optional, Any
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Any, Tuple
 from pathlib import Path
 import json
 from datetime import datetime
@@ -19,6 +22,11 @@ from utils.validators import validate_api_response, validate_crypto_data
 
 logger = setup_logger(__name__)
 
+# Keep-alive connections per host; covers fetch_coins' workers
+_POOL_SIZE = 16
+
+_MAX_CONCURRENT_REQUESTS = 8  # _make_request still spaces request starts
+
 
 class DataCollector:
     
@@ -35,6 +43,10 @@ class DataCollector:
         self.timeout = timeout
         
         self.session = requests.Session()
+        # Retries stay in _make_request, which knows about 429 backoff
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=_POOL_SIZE)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self.session.headers.update({
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json"
@@ -42,6 +54,7 @@ class DataCollector:
         
         self.last_request_time = 0
         self.min_request_interval = 1.0  # Minimum seconds between requests
+        self._rate_lock = threading.Lock()  # Requests may come from several threads
     
     def _make_request(
         self,
@@ -49,9 +62,15 @@ class DataCollector:
         params: Optional[Dict] = None,
         retry_count: int = 0
     ) -> Optional[Dict[str, Any]]:
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.min_request_interval:
-            time.sleep(self.min_request_interval - elapsed)
+        # Reserve the next start slot under the lock and wait outside it, so
+        # concurrent callers stay min_request_interval apart while their
+        # responses are still in flight
+        with self._rate_lock:
+            now = time.time()
+            wait = self.last_request_time + self.min_request_interval - now
+            self.last_request_time = now + max(wait, 0)
+        if wait > 0:
+            time.sleep(wait)
         
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
         
@@ -62,7 +81,6 @@ class DataCollector:
                 params=params,
                 timeout=self.timeout
             )
-            self.last_request_time = time.time()
             
             response.raise_for_status()  # Raises exception for 4xx/5xx codes
             
@@ -212,17 +230,41 @@ class DataCollector:
         logger.info(f"Saved data to {filepath}")
         return filepath
     
-    def collect_multiple_coins(self, symbols: List[str]) -> List[Dict[str, Any]]:
+    def fetch_coins(
+        self,
+        symbols: List[str],
+        max_workers: int = _MAX_CONCURRENT_REQUESTS
+    ) -> List[Tuple[Optional[Dict[str, Any]], Optional[Exception]]]:
+        # Requests run on worker threads so their round trips overlap;
+        # _make_request still spaces request starts by min_request_interval.
+        # Returns one (data, error) pair per symbol, in input order.
+        if not symbols:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(symbols)))) as executor:
+            return list(executor.map(self._fetch_coin, symbols))
+    
+    def _fetch_coin(self, symbol: str) -> Tuple[Optional[Dict[str, Any]], Optional[Exception]]:
+        try:
+            return self.collect_coin_data(symbol), None
+        except Exception as e:
+            return None, e
+    
+    def collect_multiple_coins(
+        self,
+        symbols: List[str],
+        max_workers: int = _MAX_CONCURRENT_REQUESTS
+    ) -> List[Dict[str, Any]]:
         results = []
         
-        for symbol in symbols:
-            data = self.collect_coin_data(symbol)
+        for symbol, (data, error) in zip(symbols, self.fetch_coins(symbols, max_workers)):
+            if error is not None:
+                logger.error(f"Error collecting {symbol}: {error}")
+            
             if data:
                 results.append(data)
             else:
                 logger.warning(f"Skipping {symbol} due to collection failure")
-            
-            time.sleep(0.5)
         
         logger.info(f"Collected data for {len(results)}/{len(symbols)} coins")
         return results
@@ -230,4 +272,10 @@ class DataCollector:
     def close(self):
         self.session.close()
         logger.debug("DataCollector session closed")
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
 
@@ -3,6 +3,7 @@ from typing import Dict, List, Any, Optional
 from datetime import datetime
 import json
 import math
+import threading
 
 from utils.logger import setup_logger
 
@@ -18,6 +19,9 @@ class DataEvaluator:
             'medium_quality_count': 0,  # 0.5 <= overall_score < 0.8
             'low_quality_count': 0  # overall_score < 0.5
         }
+        
+        # EvaluatorAgent evaluates its pipeline stages from several threads
+        self._stats_lock = threading.Lock()
     
     def evaluate_collector_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
         issues = []  # List to collect problems found
@@ -273,15 +277,18 @@ class DataEvaluator:
         return recommendations
     
     def _update_stats(self, overall_score: float):
-        self.evaluation_stats['evaluations_performed'] += 1
-        
         if overall_score >= 0.8:
-            self.evaluation_stats['high_quality_count'] += 1
+            bucket = 'high_quality_count'
         elif overall_score >= 0.5:
-            self.evaluation_stats['medium_quality_count'] += 1
+            bucket = 'medium_quality_count'
         else:
-            self.evaluation_stats['low_quality_count'] += 1
+            bucket = 'low_quality_count'
+        
+        with self._stats_lock:
+            self.evaluation_stats['evaluations_performed'] += 1
+            self.evaluation_stats[bucket] += 1
     
     def get_evaluation_stats(self) -> Dict[str, Any]:
-        return self.evaluation_stats.copy()
+        with self._stats_lock:
+            return self.evaluation_stats.copy()
 
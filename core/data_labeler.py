@@ -1,14 +1,139 @@
 
 from typing import Dict, List, Optional, Any
+from bisect import bisect_left, bisect_right
 from pathlib import Path
-import json
 from datetime import datetime 
 
+try:
+    import orjson as _json_impl
+    _USE_ORJSON = True
+except ImportError:
+    import json as _json_impl
+    _USE_ORJSON = False
+
 from config.settings import LABELED_DATA_DIR
+from core.data_standards import (
+    PRICE_MOVEMENT_LABELS,
+    VOLATILITY_LABELS,
+    TREND_LABELS,
+    PRICE_CATEGORY_LABELS,
+    CHANGE_MAGNITUDE_LABELS
+)
 from utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+_LABELING_VERSION = "1.0"
+
+
+def _dumps_line(record: Dict[str, Any]) -> bytes:
+    if _USE_ORJSON:
+        return _json_impl.dumps(record, option=_json_impl.OPT_APPEND_NEWLINE)
+    return (_json_impl.dumps(record, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+def _threshold_bin(value: float, low_breaks: tuple, high_breaks: tuple) -> int:
+    # Buckets value by the strict < / > comparisons in the trend ladder:
+    # below low_breaks[0], [low_breaks[0], low_breaks[1]), exactly the
+    # midpoint, (high_breaks[0], high_breaks[1]] and above high_breaks[1].
+    # NaN lands in the midpoint bin, where every comparison is False too.
+    return bisect_right(low_breaks, value) + bisect_left(high_breaks, value)
+
+
+# One representative (price_change, position) per bin; the last change
+# sample stands for a missing price_change.
+_TREND_CHANGE_SAMPLES = (-3.0, -1.0, 0.0, 1.0, 3.0, None)
+_TREND_POSITION_SAMPLES = (0.3, 0.45, 0.5, 0.55, 0.7)
+
+
+def _trend_for_bins(change_bin: int, position_bin: int) -> str:
+    price_change = _TREND_CHANGE_SAMPLES[change_bin]
+    position = _TREND_POSITION_SAMPLES[position_bin]
+    
+    if price_change is not None:
+        if price_change > 2 and position > 0.6:
+            return TREND_LABELS[0]  # strong_bullish
+        elif price_change > 0 or position > 0.5:
+            return TREND_LABELS[1]  # bullish
+        elif price_change < -2 and position < 0.4:
+            return TREND_LABELS[4]  # strong_bearish
+        elif price_change < 0 or position < 0.5:
+            return TREND_LABELS[3]  # bearish
+        else:
+            return TREND_LABELS[2]  # neutral
+    else:
+        if position > 0.6:
+            return TREND_LABELS[1]  # bullish
+        elif position < 0.4:
+            return TREND_LABELS[3]  # bearish
+        else:
+            return TREND_LABELS[2]  # neutral
+
+
+# Label lookup tables. Every ladder compares with strict ">" against
+# ascending thresholds, which is exactly bisect_left: the bin index is the
+# number of thresholds strictly below the value. NaN fails every comparison
+# and bisects to bin 0, matching the ladder's final else branch. Thresholds
+# are floats so bisect compares float to float.
+_PRICE_MOVEMENT_BREAKS = (-5.0, -1.0, 1.0, 5.0)
+_PRICE_MOVEMENT_BY_BIN = tuple(PRICE_MOVEMENT_LABELS[i] for i in (4, 3, 2, 1, 0))
+
+_VOLATILITY_BREAKS = (0.0, 5.0, 10.0)
+_VOLATILITY_BY_BIN = tuple(VOLATILITY_LABELS[i] for i in (3, 2, 1, 0))
+
+_PRICE_CATEGORY_BREAKS = (0.2, 0.5, 0.8)
+_PRICE_CATEGORY_BY_BIN = tuple(PRICE_CATEGORY_LABELS[i] for i in (3, 2, 1, 0))
+
+_CHANGE_MAGNITUDE_BREAKS = (0.5, 2.0, 5.0, 10.0)
+_CHANGE_MAGNITUDE_BY_BIN = tuple(CHANGE_MAGNITUDE_LABELS[i] for i in (4, 3, 2, 1, 0))
+
+_TREND_TABLE = tuple(
+    tuple(_trend_for_bins(c, p) for p in range(len(_TREND_POSITION_SAMPLES)))
+    for c in range(len(_TREND_CHANGE_SAMPLES))
+)
+
+
+def _labels_for(data: Dict[str, Any]) -> tuple:
+    # All five labels in one pass, so each input is read and the range
+    # position computed once per record, in label_data's field order.
+    price_change = data.get("price_change_24h")
+    price = data.get("price")
+    lowest = data.get("lowest_24h")
+    highest = data.get("highest_24h")
+    
+    if price_change is None:
+        movement = PRICE_MOVEMENT_LABELS[5]  # unknown
+        magnitude = CHANGE_MAGNITUDE_LABELS[5]  # unknown
+        change_bin = len(_TREND_CHANGE_SAMPLES) - 1
+    else:
+        movement = _PRICE_MOVEMENT_BY_BIN[bisect_left(_PRICE_MOVEMENT_BREAKS, price_change)]
+        magnitude = _CHANGE_MAGNITUDE_BY_BIN[bisect_left(_CHANGE_MAGNITUDE_BREAKS, abs(price_change))]
+        change_bin = _threshold_bin(price_change, (-2.0, 0.0), (0.0, 2.0))
+    
+    if price is None or lowest is None or highest is None:
+        return (
+            movement,
+            VOLATILITY_LABELS[3],  # unknown
+            TREND_LABELS[5],  # unknown
+            PRICE_CATEGORY_LABELS[4],  # unknown
+            magnitude
+        )
+    
+    price_range = highest - lowest
+    volatility_pct = (price_range / price) * 100 if price > 0 else 0
+    volatility = _VOLATILITY_BY_BIN[bisect_left(_VOLATILITY_BREAKS, volatility_pct)]
+    
+    if highest > lowest:
+        position = (price - lowest) / price_range
+        category = _PRICE_CATEGORY_BY_BIN[bisect_left(_PRICE_CATEGORY_BREAKS, position)]
+    else:
+        position = 0.5
+        category = PRICE_CATEGORY_LABELS[4]  # unknown
+    
+    trend = _TREND_TABLE[change_bin][_threshold_bin(position, (0.4, 0.5), (0.5, 0.6))]
+    
+    return movement, volatility, trend, category, magnitude
+
 
 class DataLabeler:
     
@@ -18,137 +143,44 @@ class DataLabeler:
             "labels_created": 0
         }
     
-    def label_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        labeled = data.copy()
-        
-        labeled["price_movement"] = self._label_price_movement(data)
-        
-        labeled["volatility"] = self._label_volatility(data)
-        
-        labeled["trend"] = self._label_trend(data)
-        
-        labeled["price_category"] = self._label_price_category(data)
-        
-        labeled["change_magnitude"] = self._label_change_magnitude(data)
-        
-        labeled["labeled_at"] = datetime.now().isoformat()
-        labeled["labeling_version"] = "1.0"
+    def label_data(self, data: Dict[str, Any], add_metadata: bool = True) -> Dict[str, Any]:
+        labels = self._build_labels(data, add_metadata)
         
         self.labeling_stats["records_labeled"] += 1
         self.labeling_stats["labels_created"] += 5  # We create 5 labels per record
         
-        return labeled
+        return {**data, **labels}
     
-    def _label_price_movement(self, data: Dict[str, Any]) -> str:
-        price_change = data.get("price_change_24h")
+    def _build_labels(self, data: Dict[str, Any], add_metadata: bool = True) -> Dict[str, Any]:
+        movement, volatility, trend, category, magnitude = _labels_for(data)
+        labels = {
+            "price_movement": movement,
+            "volatility": volatility,
+            "trend": trend,
+            "price_category": category,
+            "change_magnitude": magnitude
+        }
         
-        if price_change is None:
-            return "unknown"
+        if add_metadata:
+            labels["labeled_at"] = datetime.now().isoformat()
+            labels["labeling_version"] = _LABELING_VERSION
         
-        if price_change > 5:
-            return "strong_up"
-        elif price_change > 1:
-            return "up"
-        elif price_change > -1:
-            return "sideways"
-        elif price_change > -5:
-            return "down"
-        else:
-            return "strong_down"
+        return labels
+    
+    def _label_price_movement(self, data: Dict[str, Any]) -> str:
+        return _labels_for(data)[0]
     
     def _label_volatility(self, data: Dict[str, Any]) -> str:
-        price = data.get("price")
-        lowest = data.get("lowest_24h")
-        highest = data.get("highest_24h")
-        
-        if price is None or lowest is None or highest is None:
-            return "unknown"
-        
-        price_range = highest - lowest
-        volatility_pct = (price_range / price) * 100 if price > 0 else 0
-        
-        if volatility_pct > 10:
-            return "high"
-        elif volatility_pct > 5:
-            return "medium"
-        elif volatility_pct > 0:
-            return "low"
-        else:
-            return "unknown"
+        return _labels_for(data)[1]
     
     def _label_trend(self, data: Dict[str, Any]) -> str:
-        price = data.get("price")
-        lowest = data.get("lowest_24h")
-        highest = data.get("highest_24h")
-        price_change = data.get("price_change_24h")
-        
-        if price is None or lowest is None or highest is None:
-            return "unknown"
-        
-        if highest > lowest:
-            position = (price - lowest) / (highest - lowest)
-        else:
-            position = 0.5
-        
-        if price_change is not None:
-            if price_change > 2 and position > 0.6:
-                return "strong_bullish"
-            elif price_change > 0 or position > 0.5:
-                return "bullish"
-            elif price_change < -2 and position < 0.4:
-                return "strong_bearish"
-            elif price_change < 0 or position < 0.5:
-                return "bearish"
-            else:
-                return "neutral"
-        else:
-            if position > 0.6:
-                return "bullish"
-            elif position < 0.4:
-                return "bearish"
-            else:
-                return "neutral"
+        return _labels_for(data)[2]
     
     def _label_price_category(self, data: Dict[str, Any]) -> str:
-        price = data.get("price")
-        lowest = data.get("lowest_24h")
-        highest = data.get("highest_24h")
-        
-        if price is None or lowest is None or highest is None:
-            return "unknown"
-        
-        if highest > lowest:
-            position = (price - lowest) / (highest - lowest)
-        else:
-            return "unknown"
-        
-        if position > 0.8:
-            return "near_high"
-        elif position > 0.5:
-            return "above_mid"
-        elif position > 0.2:
-            return "below_mid"
-        else:
-            return "near_low"
+        return _labels_for(data)[3]
     
     def _label_change_magnitude(self, data: Dict[str, Any]) -> str:
-        price_change = data.get("price_change_24h")
-        
-        if price_change is None:
-            return "unknown"
-        
-        abs_change = abs(price_change)
-        
-        if abs_change > 10:
-            return "extreme"
-        elif abs_change > 5:
-            return "large"
-        elif abs_change > 2:
-            return "moderate"
-        elif abs_change > 0.5:
-            return "small"
-        else:
-            return "minimal"
+        return _labels_for(data)[4]
     
     def save_labeled_data(
         self,
@@ -156,23 +188,37 @@ class DataLabeler:
         filename: Optional[str] = None,
         format: str = "json"
     ) -> Path:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        symbol = data.get("symbol", "unknown")
+        if format != "json":
+            raise ValueError(f"Unsupported format: {format}")
         
         if not filename:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            symbol = data.get("symbol", "unknown")
             filename = f"{symbol}_labeled_{timestamp}.{format}"
         
+        return self.save_labeled_batch([data], filename=filename)
+    
+    def save_labeled_batch(
+        self,
+        records: List[Dict[str, Any]],
+        filename: Optional[str] = None
+    ) -> Path:
+        # NDJSON: one compact record per line, written through a single
+        # buffered handle instead of one open()/close() per record.
+        if not filename:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"labeled_batch_{timestamp}.ndjson"
+        
         filepath = LABELED_DATA_DIR / filename
         
-        if format == "json":
-            with open(filepath, "w") as f:
-                json.dump(data, f, indent=2)
-        else:
-            raise ValueError(f"Unsupported format: {format}")
+        with open(filepath, "wb", buffering=1 << 20) as f:
+            for record in records:
+                f.write(_dumps_line(record))
         
-        logger.debug(f"Saved labeled data to {filepath}")
+        logger.debug(f"Saved {len(records)} labeled record(s) to {filepath}")
         return filepath
     
     def get_labeling_stats(self) -> Dict[str, Any]:
         return self.labeling_stats.copy()
 
+
@@ -1,14 +1,31 @@
 
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, asdict
+from typing import Dict, List, Any, Optional, Tuple, Callable
+from dataclasses import dataclass, asdict, field
 from enum import Enum
+from functools import lru_cache
 import re
+import sys
 
 from utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
 
+def _vocabulary(*labels: str) -> tuple:
+    return tuple(sys.intern(label) for label in labels)
+
+
+# Canonical label vocabularies. The labeler returns these exact (interned)
+# objects, so equality checks downstream short-circuit on identity. Order
+# matters: the batch kernel emits indices into these tuples and "unknown"
+# is always the last entry.
+PRICE_MOVEMENT_LABELS = _vocabulary("strong_up", "up", "sideways", "down", "strong_down", "unknown")
+VOLATILITY_LABELS = _vocabulary("high", "medium", "low", "unknown")
+TREND_LABELS = _vocabulary("strong_bullish", "bullish", "neutral", "bearish", "strong_bearish", "unknown")
+PRICE_CATEGORY_LABELS = _vocabulary("near_high", "above_mid", "below_mid", "near_low", "unknown")
+CHANGE_MAGNITUDE_LABELS = _vocabulary("extreme", "large", "moderate", "small", "minimal", "unknown")
+
+
 class DataType(Enum):
     FLOAT = "float"
     STRING = "string"
@@ -26,18 +43,160 @@ class FieldDefinition:
     example: Any
     validation_rules: Dict[str, Any]
     source: str
-    allowed_values: Optional[List[str]] = None  # For categorical fields
+    allowed_values: Optional[Tuple[str, ...]] = None  # For categorical fields
+    _allowed_set: Optional[frozenset] = field(init=False, default=None, repr=False, compare=False)
+    _validator: Optional[Callable[[Any], List[str]]] = field(
+        init=False, default=None, repr=False, compare=False
+    )
+    
+    def __post_init__(self):
+        if self.allowed_values:
+            self._allowed_set = frozenset(self.allowed_values)
+    
+    def allows(self, value: Any) -> bool:
+        if self._allowed_set is None:
+            return True
+        try:
+            return value in self._allowed_set
+        except TypeError:  # Unhashable values can't be a categorical label
+            return False
     
     def to_dict(self) -> Dict[str, Any]:
         result = asdict(self)
+        result.pop('_allowed_set', None)
+        result.pop('_validator', None)
+        if result['allowed_values'] is not None:
+            result['allowed_values'] = list(result['allowed_values'])
         result['data_type'] = self.data_type.value
         return result
 
 
+_ISO_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}')
+
+
+def _compile_type_check(data_type: DataType) -> Callable[[Any], Optional[str]]:
+    if data_type == DataType.FLOAT:
+        def check(value):
+            if not isinstance(value, (int, float)):
+                return f"Expected float, got {type(value).__name__}"
+    elif data_type == DataType.STRING:
+        def check(value):
+            if not isinstance(value, str):
+                return f"Expected string, got {type(value).__name__}"
+    elif data_type == DataType.INTEGER:
+        def check(value):
+            if not isinstance(value, int):
+                return f"Expected integer, got {type(value).__name__}"
+    elif data_type == DataType.DATETIME:
+        def check(value):
+            if not isinstance(value, str):
+                return f"Expected datetime string, got {type(value).__name__}"
+            if not _ISO_PATTERN.match(value):
+                return f"Expected ISO8601 datetime format, got: {value}"
+    elif data_type == DataType.BOOLEAN:
+        def check(value):
+            if not isinstance(value, bool):
+                return f"Expected boolean, got {type(value).__name__}"
+    else:
+        def check(value):
+            return None
+    
+    return check
+
+
+def _compile_rule_checks(rules: Dict[str, Any], field_name: str) -> List[Callable[[Any], Optional[str]]]:
+    # One closure per configured rule, in the order errors are reported;
+    # rules that aren't configured cost nothing at validation time.
+    checks = []
+    
+    if "min" in rules:
+        minimum = rules["min"]
+        checks.append(lambda v: (
+            f"{field_name}: value {v} is below minimum {minimum}"
+            if isinstance(v, (int, float)) and v < minimum else None
+        ))
+    if "max" in rules:
+        maximum = rules["max"]
+        checks.append(lambda v: (
+            f"{field_name}: value {v} is above maximum {maximum}"
+            if isinstance(v, (int, float)) and v > maximum else None
+        ))
+    if "min_length" in rules:
+        min_length = rules["min_length"]
+        checks.append(lambda v: (
+            f"{field_name}: length {len(v)} is below minimum {min_length}"
+            if isinstance(v, str) and len(v) < min_length else None
+        ))
+    if "max_length" in rules:
+        max_length = rules["max_length"]
+        checks.append(lambda v: (
+            f"{field_name}: length {len(v)} is above maximum {max_length}"
+            if isinstance(v, str) and len(v) > max_length else None
+        ))
+    if "pattern" in rules:
+        pattern = rules["pattern"]
+        compiled = re.compile(pattern)
+        checks.append(lambda v: (
+            f"{field_name}: value '{v}' doesn't match pattern {pattern}"
+            if isinstance(v, str) and not compiled.match(v) else None
+        ))
+    if rules.get("uppercase"):
+        checks.append(lambda v: (
+            f"{field_name}: value should be uppercase"
+            if isinstance(v, str) and not v.isupper() else None
+        ))
+    if rules.get("lowercase"):
+        checks.append(lambda v: (
+            f"{field_name}: value should be lowercase"
+            if isinstance(v, str) and not v.islower() else None
+        ))
+    
+    return checks
+
+
+def _compile_validator(field_def: FieldDefinition) -> Callable[[Any], List[str]]:
+    field_name = field_def.name
+    required = field_def.required
+    type_check = _compile_type_check(field_def.data_type)
+    rule_checks = _compile_rule_checks(field_def.validation_rules, field_name)
+    
+    if field_def._allowed_set is not None:
+        allowed_list = list(field_def.allowed_values)
+        allows = field_def.allows
+        rule_checks.append(lambda v: (
+            f"{field_name}: value '{v}' not in allowed values: {allowed_list}"
+            if not allows(v) else None
+        ))
+    
+    def validator(value: Any) -> List[str]:
+        if required and (value is None or value == ""):
+            return [f"{field_name} is required but is missing or empty"]
+        
+        if value is None:
+            return []
+        
+        errors = []
+        
+        type_error = type_check(value)
+        if type_error:
+            errors.append(type_error)
+        
+        for check in rule_checks:
+            error = check(value)
+            if error:
+                errors.append(error)
+        
+        return errors
+    
+    return validator
+
+
 class DataDictionary:
     
     def __init__(self):
         self.fields = self._initialize_fields()
+        for field_def in self.fields.values():
+            field_def._validator = _compile_validator(field_def)
         self.version = "1.0"
         self.last_updated = "2025-01-03"
     
@@ -137,7 +296,7 @@ class DataDictionary:
                 example="strong_up",
                 validation_rules={},
                 source="Generated by labeler agent",
-                allowed_values=["strong_up", "up", "sideways", "down", "strong_down", "unknown"]
+                allowed_values=PRICE_MOVEMENT_LABELS
             ),
             "volatility": FieldDefinition(
                 name="volatility",
@@ -147,7 +306,7 @@ class DataDictionary:
                 example="medium",
                 validation_rules={},
                 source="Generated by labeler agent",
-                allowed_values=["high", "medium", "low", "unknown"]
+                allowed_values=VOLATILITY_LABELS
             ),
             "trend": FieldDefinition(
                 name="trend",
@@ -157,7 +316,7 @@ class DataDictionary:
                 example="bullish",
                 validation_rules={},
                 source="Generated by labeler agent",
-                allowed_values=["strong_bullish", "bullish", "neutral", "bearish", "strong_bearish"]
+                allowed_values=TREND_LABELS
             ),
             "price_category": FieldDefinition(
                 name="price_category",
@@ -167,7 +326,7 @@ class DataDictionary:
                 example="above_mid",
                 validation_rules={},
                 source="Generated by labeler agent",
-                allowed_values=["near_high", "above_mid", "below_mid", "near_low", "unknown"]
+                allowed_values=PRICE_CATEGORY_LABELS
             ),
             "change_magnitude": FieldDefinition(
                 name="change_magnitude",
@@ -177,7 +336,7 @@ class DataDictionary:
                 example="moderate",
                 validation_rules={},
                 source="Generated by labeler agent",
-                allowed_values=["extreme", "large", "moderate", "small", "minimal", "unknown"]
+                allowed_values=CHANGE_MAGNITUDE_LABELS
             ),
             "cleaned_at": FieldDefinition(
                 name="cleaned_at",
@@ -209,35 +368,31 @@ class DataDictionary:
         return self.fields.get(field_name)
     
     def validate_field(self, field_name: str, value: Any) -> List[str]:
-        errors = []
+        field_def = self.fields.get(field_name)
         
-        if field_name not in self.fields:
+        if field_def is None:
             return [f"Unknown field: {field_name}"]
         
-        field_def = self.fields[field_name]
-        
-        if field_def.required and (value is None or value == ""):
-            errors.append(f"{field_name} is required but is missing or empty")
-            return errors  # Can't validate further if required field is missing
-        
-        if value is None:
-            return errors
-        
-        type_error = self._validate_type(value, field_def.data_type)
-        if type_error:
-            errors.append(type_error)
-        
-        rule_errors = self._validate_rules(value, field_def.validation_rules, field_name)
-        errors.extend(rule_errors)
+        if field_def._validator is None:
+            field_def._validator = _compile_validator(field_def)
         
-        if field_def.allowed_values and value not in field_def.allowed_values:
-            errors.append(
-                f"{field_name}: value '{value}' not in allowed values: {field_def.allowed_values}"
-            )
-        
-        return errors
+        return field_def._validator(value)
+    
+    def validate_fields(self, data: Dict[str, Any]) -> Dict[str, List[str]]:
+        # Per-field errors for every dictionary field present in data
+        return {
+            field_name: self.validate_field(field_name, data[field_name])
+            for field_name in self.fields
+            if field_name in data
+        }
     
-    def validate_data(self, data: Dict[str, Any]) -> Dict[str, List[str]]:
+    def validate_data(
+        self,
+        data: Dict[str, Any],
+        field_errors: Optional[Dict[str, List[str]]] = None
+    ) -> Dict[str, List[str]]:
+        # field_errors: a validate_fields() result to reuse instead of
+        # running the validators again
         errors = {
             "missing_required": [],
             "type_errors": [],
@@ -245,74 +400,28 @@ class DataDictionary:
             "unknown_fields": []
         }
         
-        for field_name in data:
-            if field_name not in self.fields:
-                errors["unknown_fields"].append(field_name)
+        unknown = data.keys() - self.fields.keys()
+        if unknown:
+            errors["unknown_fields"] = [name for name in data if name in unknown]  # Keep input order
         
         for field_name, field_def in self.fields.items():
-            if field_def.required:
-                if field_name not in data or data[field_name] is None:
+            value = data.get(field_name)
+            
+            if value is None:
+                if field_def.required:
                     errors["missing_required"].append(f"{field_name} is required")
-                    continue  # Skip further validation for missing required fields
+                continue  # Nothing further to validate for an absent/None value
             
-            if field_name in data:
-                field_errors = self.validate_field(field_name, data[field_name])
-                
-                for error in field_errors:
-                    if "type" in error.lower() or "expected" in error.lower():
-                        errors["type_errors"].append(error)
-                    else:
-                        errors["validation_errors"].append(error)
-        
-        return errors
-    
-    def _validate_type(self, value: Any, expected_type: DataType) -> Optional[str]:
-        if expected_type == DataType.FLOAT:
-            if not isinstance(value, (int, float)):
-                return f"Expected float, got {type(value).__name__}"
-        elif expected_type == DataType.STRING:
-            if not isinstance(value, str):
-                return f"Expected string, got {type(value).__name__}"
-        elif expected_type == DataType.INTEGER:
-            if not isinstance(value, int):
-                return f"Expected integer, got {type(value).__name__}"
-        elif expected_type == DataType.DATETIME:
-            if not isinstance(value, str):
-                return f"Expected datetime string, got {type(value).__name__}"
-            iso_pattern = r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}'
-            if not re.match(iso_pattern, value):
-                return f"Expected ISO8601 datetime format, got: {value}"
-        elif expected_type == DataType.BOOLEAN:
-            if not isinstance(value, bool):
-                return f"Expected boolean, got {type(value).__name__}"
-        
-        return None
-    
-    def _validate_rules(self, value: Any, rules: Dict[str, Any], field_name: str) -> List[str]:
-        errors = []
-        
-        if isinstance(value, (int, float)):
-            if "min" in rules and value < rules["min"]:
-                errors.append(f"{field_name}: value {value} is below minimum {rules['min']}")
-            if "max" in rules and value > rules["max"]:
-                errors.append(f"{field_name}: value {value} is above maximum {rules['max']}")
-        
-        if isinstance(value, str):
-            if "min_length" in rules and len(value) < rules["min_length"]:
-                errors.append(
-                    f"{field_name}: length {len(value)} is below minimum {rules['min_length']}"
-                )
-            if "max_length" in rules and len(value) > rules["max_length"]:
-                errors.append(
-                    f"{field_name}: length {len(value)} is above maximum {rules['max_length']}"
-                )
-            if "pattern" in rules:
-                if not re.match(rules["pattern"], value):
-                    errors.append(f"{field_name}: value '{value}' doesn't match pattern {rules['pattern']}")
-            if "uppercase" in rules and rules["uppercase"] and not value.isupper():
-                errors.append(f"{field_name}: value should be uppercase")
-            if "lowercase" in rules and rules["lowercase"] and not value.islower():
-                errors.append(f"{field_name}: value should be lowercase")
+            if field_errors is not None:
+                value_errors = field_errors[field_name]
+            else:
+                value_errors = self.validate_field(field_name, value)
+            
+            for error in value_errors:
+                if "type" in error.lower() or "expected" in error.lower():
+                    errors["type_errors"].append(error)
+                else:
+                    errors["validation_errors"].append(error)
         
         return errors
     
@@ -365,3 +474,10 @@ class DataDictionary:
         
         return "\n".join(lines)
 
+
+@lru_cache(maxsize=1)
+def get_data_dictionary() -> DataDictionary:
+    # The dictionary is static, so one instance (with its compiled field
+    # validators) is shared by every reporter and command in the process
+    return DataDictionary()
+
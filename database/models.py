@@ -1,14 +1,71 @@
 
-from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, Date, Text
+from sqlalchemy import create_engine, event, insert, Column, Integer, BigInteger, String, Float, DateTime, Date, Text, LargeBinary, Index, Computed, inspect, text
+from sqlalchemy.types import TypeDecorator
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import sessionmaker, scoped_session
 from datetime import datetime, date
+from functools import cached_property, lru_cache
 from pathlib import Path
-import json
+from typing import List, Dict, Any, Optional
+import threading
+import zlib
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 Base = declarative_base()
 
 
+# Preset deflate dictionary of the keys, field names and phrases the
+# evaluator writes. Rows are ~50-100 bytes of near-identical JSON, which is
+# too short for plain deflate to gain anything; against this dictionary they
+# shrink to a handful of back-references. Packed values are prefixed with a
+# format byte, so a new dictionary must be added as a new format, never by
+# editing this one (existing rows would no longer decode).
+_PACKED_JSON_V1 = b'\x01'
+_PACKED_JSON_ZDICT_V1 = (
+    b'["Add validation rules to catch invalid values during collection", '
+    b'"Review data transformation logic for consistency issues"]'
+    b'["Data quality is excellent - maintain current standards"]'
+    b'["Improve data collection to ensure all required fields are present"]'
+    b'["cleaned_at", "symbol", "price", "market_cap", "volume_24h", "price_change_24h"]'
+    b'["price_movement", "volatility", "trend", "price_category", "change_magnitude", "symbol"]'
+    b'{"missing_labels_count": 0, "accuracy_issues_count": 0, "consistency_issues_count": 0}'
+    b'{"missing_fields_count": 2, "accuracy_issues_count": 0, "consistency_issues_count": 0}'
+)
+
+
+def _pack_json_text(value: str) -> bytes:
+    compressor = zlib.compressobj(9, zlib.DEFLATED, -15, zdict=_PACKED_JSON_ZDICT_V1)
+    return _PACKED_JSON_V1 + compressor.compress(value.encode('utf-8')) + compressor.flush()
+
+
+def _unpack_json_text(value: bytes) -> str:
+    if value[:1] != _PACKED_JSON_V1:
+        return value.decode('utf-8')
+    decompressor = zlib.decompressobj(-15, zdict=_PACKED_JSON_ZDICT_V1)
+    return (decompressor.decompress(value[1:]) + decompressor.flush()).decode('utf-8')
+
+
+class PackedJSONText(TypeDecorator):
+    # JSON text in Python, dictionary-compressed BLOB on disk. Rows written
+    # before packing was introduced are still plain TEXT and read back as-is.
+    impl = LargeBinary
+    cache_ok = True
+    
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return _pack_json_text(value)
+    
+    def process_result_value(self, value, dialect):
+        if value is None or isinstance(value, str):
+            return value
+        return _unpack_json_text(bytes(value))
+
+
 class Evaluation(Base):
     __tablename__ = 'evaluations'
     
@@ -20,63 +77,152 @@ class Evaluation(Base):
     
     evaluation_timestamp = Column(DateTime, default=datetime.now)
     
+    # Unix seconds derived from evaluation_timestamp (read as UTC) so range
+    # filters compare integers on the index instead of ISO text
+    evaluation_ts_epoch = Column(
+        BigInteger,
+        Computed("CAST(strftime('%s', evaluation_timestamp) AS INTEGER)", persisted=False)
+    )
+    # Calendar day of evaluation_timestamp, indexable for daily grouping
+    eval_date = Column(Date, Computed("date(evaluation_timestamp)", persisted=False))
+    
     completeness_score = Column(Float)
     accuracy_score = Column(Float)
     consistency_score = Column(Float)
     overall_score = Column(Float)
     
-    metrics_json = Column(Text)  # Stores detailed metrics as JSON
-    evaluated_fields = Column(Text)  # List of fields that were checked
-    issues_found = Column(Text)  # List of problems found
-    recommendations = Column(Text)  # Suggestions for improvement
+    metrics_json = Column(PackedJSONText)  # Stores detailed metrics as JSON
+    evaluated_fields = Column(PackedJSONText)  # List of fields that were checked
+    issues_found = Column(Text)  # List of problems found (plain TEXT: get_top_issues runs json_each on it)
+    recommendations = Column(PackedJSONText)  # Suggestions for improvement
     
     pipeline_run_id = Column(String(100))  # Groups evaluations from same pipeline run
     data_file_path = Column(Text)  # Path to the data file that was evaluated
     evaluation_version = Column(String(20), default='1.0')  # Version of evaluation logic
     
-    def to_dict(self):
-        return {
-            'id': self.id,
-            'agent_type': self.agent_type,
-            'symbol': self.symbol,
-            'evaluation_timestamp': self.evaluation_timestamp.isoformat() if self.evaluation_timestamp else None,
-            'completeness_score': self.completeness_score,
-            'accuracy_score': self.accuracy_score,
-            'consistency_score': self.consistency_score,
-            'overall_score': self.overall_score,
-            'metrics_json': json.loads(self.metrics_json) if self.metrics_json else None,
-            'evaluated_fields': json.loads(self.evaluated_fields) if self.evaluated_fields else None,
-            'issues_found': json.loads(self.issues_found) if self.issues_found else None,
-            'recommendations': json.loads(self.recommendations) if self.recommendations else None,
-            'pipeline_run_id': self.pipeline_run_id,
-            'data_file_path': self.data_file_path,
-            'evaluation_version': self.evaluation_version
-        }
+    # (agent_type, evaluation_timestamp) serves the per-agent range scans and
+    # "latest N" sorts; the timestamp-only index serves the cross-agent ones.
+    __table_args__ = (
+        Index('idx_evaluations_agent_ts', 'agent_type', 'evaluation_timestamp'),
+        Index('idx_evaluations_timestamp', 'evaluation_timestamp'),
+        # Carries the four scores after the range key so the per-agent
+        # averages are answered from the index without visiting table rows
+        Index(
+            'idx_evaluations_agent_epoch_scores', 'agent_type', 'evaluation_ts_epoch',
+            'completeness_score', 'accuracy_score', 'consistency_score', 'overall_score'
+        ),
+        Index('idx_evaluations_epoch', 'evaluation_ts_epoch'),
+        Index('idx_evaluations_agent_date', 'agent_type', 'eval_date'),
+        Index('idx_evaluations_overall_score', 'overall_score'),
+        Index('idx_evaluations_pipeline_run', 'pipeline_run_id'),
+        # Clean runs store NULL or an empty '[]' list; the top-issues scan
+        # only needs the rest, so index just those rows
+        Index(
+            'idx_eval_issues_notnull', 'agent_type',
+            sqlite_where=text("issues_found IS NOT NULL AND issues_found <> '[]'")
+        ),
+    )
+    
+    # Decoded JSON columns, parsed on first access and kept for the life of
+    # the instance; evaluations are written once, so they don't go stale
+    @cached_property
+    def parsed_metrics(self) -> Optional[Dict[str, Any]]:
+        return _json_loads(self.metrics_json) if self.metrics_json else None
+    
+    @cached_property
+    def parsed_evaluated_fields(self) -> Optional[List[str]]:
+        return _json_loads(self.evaluated_fields) if self.evaluated_fields else None
+    
+    @cached_property
+    def parsed_issues(self) -> Optional[List[str]]:
+        return _json_loads(self.issues_found) if self.issues_found else None
+    
+    @cached_property
+    def parsed_recommendations(self) -> Optional[List[str]]:
+        return _json_loads(self.recommendations) if self.recommendations else None
+    
+    def to_dict(self, include_json: bool = True):
+        return evaluation_to_dict(self, include_json=include_json)
+
+
+def evaluation_to_dict(row, include_json: bool = True) -> Dict[str, Any]:
+    # Works for Evaluation instances and for Core rows selected from
+    # EVALUATION_COLUMNS, which expose the same attribute names.
+    # include_json=False leaves out the four JSON columns (and their decode
+    # cost) for callers that only need scores and identifiers.
+    result = {
+        'id': row.id,
+        'agent_type': row.agent_type,
+        'symbol': row.symbol,
+        'evaluation_timestamp': row.evaluation_timestamp.isoformat() if row.evaluation_timestamp else None,
+        'completeness_score': row.completeness_score,
+        'accuracy_score': row.accuracy_score,
+        'consistency_score': row.consistency_score,
+        'overall_score': row.overall_score
+    }
+    
+    if include_json:
+        if isinstance(row, Evaluation):
+            result['metrics_json'] = row.parsed_metrics
+            result['evaluated_fields'] = row.parsed_evaluated_fields
+            result['issues_found'] = row.parsed_issues
+            result['recommendations'] = row.parsed_recommendations
+        else:
+            result['metrics_json'] = _json_loads(row.metrics_json) if row.metrics_json else None
+            result['evaluated_fields'] = _json_loads(row.evaluated_fields) if row.evaluated_fields else None
+            result['issues_found'] = _json_loads(row.issues_found) if row.issues_found else None
+            result['recommendations'] = _json_loads(row.recommendations) if row.recommendations else None
+    
+    result['pipeline_run_id'] = row.pipeline_run_id
+    result['data_file_path'] = row.data_file_path
+    result['evaluation_version'] = row.evaluation_version
+    return result
+
+
+# Stored (non-generated) evaluation columns, i.e. what to_dict() reports
+EVALUATION_COLUMNS = tuple(
+    column for column in Evaluation.__table__.columns if column.computed is None
+)
 
 
 class EvaluationSummary(Base):
     __tablename__ = 'evaluation_summary'
     
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    
-    agent_type = Column(String(50), nullable=False)
-    summary_date = Column(Date, nullable=False)  # Date only, not datetime
+    # Natural key: one row per agent and day. Stored WITHOUT ROWID, so the
+    # table is a single B-tree ordered by (agent_type, summary_date)
+    agent_type = Column(String(50), primary_key=True)
+    summary_date = Column(Date, primary_key=True)  # Date only, not datetime
     
     avg_completeness = Column(Float)
     avg_accuracy = Column(Float)
     avg_consistency = Column(Float)
     avg_overall_score = Column(Float)
     
+    # Running sums and non-NULL counts behind the averages, so the insert
+    # trigger can fold in one evaluation at a time
+    completeness_sum = Column(Float, default=0)
+    accuracy_sum = Column(Float, default=0)
+    consistency_sum = Column(Float, default=0)
+    overall_sum = Column(Float, default=0)
+    completeness_count = Column(Integer, default=0)
+    accuracy_count = Column(Integer, default=0)
+    consistency_count = Column(Integer, default=0)
+    overall_count = Column(Integer, default=0)
+    
+    # Buckets match get_quality_distribution and DataEvaluator's stats
     total_evaluations = Column(Integer, default=0)
-    high_quality_count = Column(Integer, default=0)  # overall_score > 0.8
-    medium_quality_count = Column(Integer, default=0)  # 0.5 <= overall_score <= 0.8
+    high_quality_count = Column(Integer, default=0)  # overall_score >= 0.8
+    medium_quality_count = Column(Integer, default=0)  # 0.5 <= overall_score < 0.8
     low_quality_count = Column(Integer, default=0)  # overall_score < 0.5
     
     top_issues = Column(Text)
     
+    __table_args__ = (
+        {'sqlite_with_rowid': False},
+    )
+    
     def to_dict(self):
         return {
-            'id': self.id,
             'agent_type': self.agent_type,
             'summary_date': self.summary_date.isoformat() if self.summary_date else None,
             'avg_completeness': self.avg_completeness,
@@ -87,7 +233,7 @@ class EvaluationSummary(Base):
             'high_quality_count': self.high_quality_count,
             'medium_quality_count': self.medium_quality_count,
             'low_quality_count': self.low_quality_count,
-            'top_issues': json.loads(self.top_issues) if self.top_issues else None
+            'top_issues': _json_loads(self.top_issues) if self.top_issues else None
         }
 
 
@@ -144,6 +290,11 @@ class Anomaly(Base):
     
     check_run_id = Column(String(100))
     
+    __table_args__ = (
+        Index('idx_anomalies_agent_ts', 'agent_type', 'detection_timestamp'),
+        Index('idx_anomalies_status', 'status'),
+    )
+    
     def to_dict(self):
         return {
             'id': self.id,
@@ -157,7 +308,7 @@ class Anomaly(Base):
             'historical_std': self.historical_std,
             'z_score': self.z_score,
             'message': self.message,
-            'anomaly_details': json.loads(self.anomaly_details) if self.anomaly_details else None,
+            'anomaly_details': _json_loads(self.anomaly_details) if self.anomaly_details else None,
             'status': self.status,
             'acknowledged_by': self.acknowledged_by,
             'acknowledged_at': self.acknowledged_at.isoformat() if self.acknowledged_at else None,
@@ -166,21 +317,299 @@ class Anomaly(Base):
         }
 
 
+# Applied once per pooled DBAPI connection. WAL lets dashboard reads run
+# alongside pipeline writes, and with synchronous=NORMAL a commit no longer
+# fsyncs twice.
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-65536",  # 64 MiB page cache
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",  # 256 MiB
+)
+
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in _SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
+# Recomputes evaluation_summary rows for every day on or after :since_date,
+# upserting on the (agent_type, summary_date) key. Used to backfill; new
+# evaluations are folded in by _SUMMARY_TRIGGER_SQL as they are inserted.
+# Quality buckets follow the EvaluationSummary column definitions.
+_INSERT_SUMMARIES_SQL = text("""
+    INSERT INTO evaluation_summary (
+        agent_type, summary_date,
+        avg_completeness, avg_accuracy, avg_consistency, avg_overall_score,
+        completeness_sum, accuracy_sum, consistency_sum, overall_sum,
+        completeness_count, accuracy_count, consistency_count, overall_count,
+        total_evaluations, high_quality_count, medium_quality_count, low_quality_count
+    )
+    SELECT
+        agent_type,
+        eval_date,
+        AVG(completeness_score),
+        AVG(accuracy_score),
+        AVG(consistency_score),
+        AVG(overall_score),
+        TOTAL(completeness_score),
+        TOTAL(accuracy_score),
+        TOTAL(consistency_score),
+        TOTAL(overall_score),
+        COUNT(completeness_score),
+        COUNT(accuracy_score),
+        COUNT(consistency_score),
+        COUNT(overall_score),
+        COUNT(id),
+        SUM(CASE WHEN overall_score >= 0.8 THEN 1 ELSE 0 END),
+        SUM(CASE WHEN overall_score >= 0.5 AND overall_score < 0.8 THEN 1 ELSE 0 END),
+        SUM(CASE WHEN overall_score < 0.5 THEN 1 ELSE 0 END)
+    FROM evaluations
+    WHERE eval_date IS NOT NULL
+      AND (:since_date IS NULL OR eval_date >= :since_date)
+    GROUP BY agent_type, eval_date
+    ON CONFLICT (agent_type, summary_date) DO UPDATE SET
+        avg_completeness = excluded.avg_completeness,
+        avg_accuracy = excluded.avg_accuracy,
+        avg_consistency = excluded.avg_consistency,
+        avg_overall_score = excluded.avg_overall_score,
+        completeness_sum = excluded.completeness_sum,
+        accuracy_sum = excluded.accuracy_sum,
+        consistency_sum = excluded.consistency_sum,
+        overall_sum = excluded.overall_sum,
+        completeness_count = excluded.completeness_count,
+        accuracy_count = excluded.accuracy_count,
+        consistency_count = excluded.consistency_count,
+        overall_count = excluded.overall_count,
+        total_evaluations = excluded.total_evaluations,
+        high_quality_count = excluded.high_quality_count,
+        medium_quality_count = excluded.medium_quality_count,
+        low_quality_count = excluded.low_quality_count
+""")
+
+# Keeps evaluation_summary current for every insert path (ORM, Core bulk
+# insert, raw SQL): each new evaluation adds into its agent/day row. In DO
+# UPDATE, bare column names are the row's values before this insert.
+_SUMMARY_TRIGGER_SQL = text("""
+    CREATE TRIGGER IF NOT EXISTS trg_evaluations_summary_insert
+    AFTER INSERT ON evaluations
+    WHEN NEW.evaluation_timestamp IS NOT NULL
+    BEGIN
+        INSERT INTO evaluation_summary (
+            agent_type, summary_date,
+            avg_completeness, avg_accuracy, avg_consistency, avg_overall_score,
+            completeness_sum, accuracy_sum, consistency_sum, overall_sum,
+            completeness_count, accuracy_count, consistency_count, overall_count,
+            total_evaluations, high_quality_count, medium_quality_count, low_quality_count
+        )
+        VALUES (
+            NEW.agent_type, date(NEW.evaluation_timestamp),
+            NEW.completeness_score, NEW.accuracy_score, NEW.consistency_score, NEW.overall_score,
+            IFNULL(NEW.completeness_score, 0), IFNULL(NEW.accuracy_score, 0),
+            IFNULL(NEW.consistency_score, 0), IFNULL(NEW.overall_score, 0),
+            NEW.completeness_score IS NOT NULL, NEW.accuracy_score IS NOT NULL,
+            NEW.consistency_score IS NOT NULL, NEW.overall_score IS NOT NULL,
+            1,
+            IFNULL(NEW.overall_score >= 0.8, 0),
+            IFNULL(NEW.overall_score >= 0.5 AND NEW.overall_score < 0.8, 0),
+            IFNULL(NEW.overall_score < 0.5, 0)
+        )
+        ON CONFLICT (agent_type, summary_date) DO UPDATE SET
+            completeness_sum = completeness_sum + excluded.completeness_sum,
+            accuracy_sum = accuracy_sum + excluded.accuracy_sum,
+            consistency_sum = consistency_sum + excluded.consistency_sum,
+            overall_sum = overall_sum + excluded.overall_sum,
+            completeness_count = completeness_count + excluded.completeness_count,
+            accuracy_count = accuracy_count + excluded.accuracy_count,
+            consistency_count = consistency_count + excluded.consistency_count,
+            overall_count = overall_count + excluded.overall_count,
+            avg_completeness = (completeness_sum + excluded.completeness_sum)
+                / NULLIF(completeness_count + excluded.completeness_count, 0),
+            avg_accuracy = (accuracy_sum + excluded.accuracy_sum)
+                / NULLIF(accuracy_count + excluded.accuracy_count, 0),
+            avg_consistency = (consistency_sum + excluded.consistency_sum)
+                / NULLIF(consistency_count + excluded.consistency_count, 0),
+            avg_overall_score = (overall_sum + excluded.overall_sum)
+                / NULLIF(overall_count + excluded.overall_count, 0),
+            total_evaluations = total_evaluations + 1,
+            high_quality_count = high_quality_count + excluded.high_quality_count,
+            medium_quality_count = medium_quality_count + excluded.medium_quality_count,
+            low_quality_count = low_quality_count + excluded.low_quality_count;
+    END
+""")
+
+
+# Indexes that were superseded by a wider declared index
+_RETIRED_INDEXES = (
+    'idx_evaluations_agent_epoch',  # Prefix of idx_evaluations_agent_epoch_scores
+)
+
+
+def _note_evaluation_writes(session, flush_context):
+    # Flagged per session and acted on at commit, so a rolled-back flush
+    # doesn't invalidate anything
+    changed = (*session.new, *session.dirty, *session.deleted)
+    if any(isinstance(obj, Evaluation) for obj in changed):
+        session.info['evaluations_written'] = True
+
+
+def _forget_evaluation_writes(session):
+    session.info.pop('evaluations_written', None)
+
+
 class DatabaseManager:
     
     def __init__(self, db_path: str = "data/evaluations.db"):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         
-        self.engine = create_engine(f'sqlite:///{self.db_path}', echo=False)
+        self.engine = create_engine(
+            f'sqlite:///{self.db_path}',
+            echo=False,
+            connect_args={"check_same_thread": False},
+            pool_size=8,
+            pool_pre_ping=True,
+            pool_recycle=3600,
+            query_cache_size=1200
+        )
+        event.listen(self.engine, "connect", _apply_sqlite_pragmas)
         
         self.SessionLocal = sessionmaker(bind=self.engine)
+        # Thread-local session reused by short read queries: close() hands
+        # the connection back to the pool but keeps the Session for the
+        # thread's next call
+        self.Session = scoped_session(self.SessionLocal)
+        
+        # Bumped on every evaluation write; query-result caches key on it.
+        # ORM sessions from this manager bump it too when they commit a
+        # flush that touched Evaluation rows.
+        self.evaluations_version = 0
+        # Evaluator stage threads write concurrently; a lost increment would
+        # leave a stale cached result valid for its whole TTL
+        self._version_lock = threading.Lock()
+        event.listen(self.SessionLocal, "after_flush", _note_evaluation_writes)
+        event.listen(self.SessionLocal, "after_commit", self._bump_version_after_commit)
+        event.listen(self.SessionLocal, "after_rollback", _forget_evaluation_writes)
         
+        self._migrate_summary_table()
         Base.metadata.create_all(self.engine)
+        self._ensure_columns()
+        self._ensure_indexes()
+        self._ensure_summaries()
+        
+        with self.engine.begin() as conn:
+            conn.execute(_SUMMARY_TRIGGER_SQL)
+    
+    def _migrate_summary_table(self):
+        # Older evaluation_summary layouts (a surrogate id primary key, no
+        # running sums) can't be upgraded in place. The rows are derived from
+        # evaluations, so such a table is dropped here and recreated and
+        # backfilled by the steps that follow.
+        inspector = inspect(self.engine)
+        if not inspector.has_table('evaluation_summary'):
+            return
+        
+        columns = {col['name'] for col in inspector.get_columns('evaluation_summary')}
+        if 'id' in columns or 'overall_count' not in columns:
+            with self.engine.begin() as conn:
+                conn.execute(text("DROP TABLE evaluation_summary"))
+    
+    def _ensure_columns(self):
+        # Adds columns declared after a table was created. Only columns
+        # SQLite can add in place belong here (nullable or VIRTUAL generated).
+        inspector = inspect(self.engine)
+        ddl = self.engine.dialect.ddl_compiler(self.engine.dialect, None)
+        
+        with self.engine.begin() as conn:
+            for table in Base.metadata.sorted_tables:
+                existing = {col['name'] for col in inspector.get_columns(table.name)}
+                for column in table.columns:
+                    if column.name not in existing:
+                        spec = ddl.get_column_specification(column)
+                        conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {spec}"))
+    
+    def _ensure_indexes(self):
+        # create_all() skips the indexes of tables that already exist, so
+        # databases created before an index was declared need it added here.
+        inspector = inspect(self.engine)
+        created = False
+        
+        with self.engine.begin() as conn:
+            for name in _RETIRED_INDEXES:
+                conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+        
+        for table in Base.metadata.sorted_tables:
+            existing = {ix['name'] for ix in inspector.get_indexes(table.name)}
+            for index in table.indexes:
+                if index.name not in existing:
+                    index.create(self.engine)
+                    created = True
+        
+        if created:
+            # Refresh planner statistics so the new indexes get picked up
+            with self.engine.begin() as conn:
+                conn.execute(text("ANALYZE"))
+    
+    def _ensure_summaries(self):
+        # Backfill databases that have evaluations but were never summarized
+        with self.engine.connect() as conn:
+            has_summaries = conn.execute(text("SELECT 1 FROM evaluation_summary LIMIT 1")).first()
+            has_evaluations = conn.execute(text("SELECT 1 FROM evaluations LIMIT 1")).first()
+        
+        if has_evaluations and not has_summaries:
+            self.refresh_summaries()
+    
+    def refresh_summaries(self, since: Optional[date] = None):
+        # Recomputes the daily per-agent aggregates for days >= since (all
+        # days when since is None) in one transaction.
+        params = {"since_date": since.isoformat() if since else None}
+        
+        with self.engine.begin() as conn:
+            conn.execute(_INSERT_SUMMARIES_SQL, params)
+        self._bump_evaluations_version()
+    
+    def _bump_version_after_commit(self, session):
+        if session.info.pop('evaluations_written', False):
+            self._bump_evaluations_version()
+    
+    def _bump_evaluations_version(self):
+        with self._version_lock:
+            self.evaluations_version += 1
     
     def get_session(self):
         return self.SessionLocal()
     
+    def bulk_insert_evaluations(self, rows: List[Dict[str, Any]]) -> int:
+        # One transaction and one executemany for the whole batch instead of
+        # an ORM add/commit (and fsync) per evaluation
+        if not rows:
+            return 0
+        
+        # trg_evaluations_summary_insert folds the rows into evaluation_summary
+        # inside the same transaction
+        with self.engine.begin() as conn:
+            conn.execute(insert(Evaluation), rows)
+        self._bump_evaluations_version()
+        
+        return len(rows)
+    
     def close(self):
+        self.Session.remove()
         self.engine.dispose()
 
+
+@lru_cache(maxsize=None)
+def _manager_for(resolved_path: str) -> DatabaseManager:
+    return DatabaseManager(resolved_path)
+
+
+def get_manager(db_path: str = "data/evaluations.db") -> DatabaseManager:
+    # One DatabaseManager (engine, pool, schema checks) per database file for
+    # the whole process. close() only disposes pooled connections, and the
+    # engine reconnects on next use, so sharing it across owners is safe.
+    return _manager_for(str(Path(db_path).resolve()))
@@ -1,9 +1,157 @@
 
-from sqlalchemy import func, and_, or_, text
-from datetime import datetime, date, timedelta
-from typing import List, Dict, Optional
-import json
-from database.models import Evaluation, EvaluationSummary, PipelineRun, DatabaseManager
+from sqlalchemy import func, and_, or_, text, select, bindparam, tuple_
+from sqlalchemy.exc import OperationalError
+from datetime import datetime, date, timedelta, timezone
+from typing import List, Dict, Optional, Tuple, Union, Iterator, Callable, Any
+from collections import Counter, OrderedDict
+from itertools import chain
+from operator import itemgetter
+import copy
+import heapq
+import threading
+import time
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+from database.models import (
+    Evaluation,
+    EvaluationSummary,
+    PipelineRun,
+    DatabaseManager,
+    EVALUATION_COLUMNS,
+    evaluation_to_dict
+)
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+def _epoch_cutoff(days: int) -> int:
+    # evaluation_ts_epoch reads the naive stored timestamps as UTC, so the
+    # cutoff is converted the same way to keep the comparison consistent.
+    cutoff_date = datetime.now() - timedelta(days=days)
+    return int(cutoff_date.replace(tzinfo=timezone.utc).timestamp())
+
+
+# Bucket counts come from evaluation_summary, which the insert trigger keeps
+# current, so this sums a few rows per agent and day instead of scanning
+# evaluations. The per-agent variant is a primary-key prefix lookup.
+_QUALITY_DISTRIBUTION_COLUMNS = """
+    SELECT
+        COALESCE(SUM(total_evaluations), 0) AS total,
+        COALESCE(SUM(high_quality_count), 0) AS high_quality,
+        COALESCE(SUM(medium_quality_count), 0) AS medium_quality,
+        COALESCE(SUM(low_quality_count), 0) AS low_quality
+    FROM evaluation_summary
+"""
+_QUALITY_DISTRIBUTION_SQL = text(_QUALITY_DISTRIBUTION_COLUMNS)
+_QUALITY_DISTRIBUTION_BY_AGENT_SQL = text(_QUALITY_DISTRIBUTION_COLUMNS + " WHERE agent_type = :agent_type")
+
+
+# Issue counts unnested by json_each inside SQLite; only `limit` rows come
+# back. The non-empty predicate matches idx_eval_issues_notnull.
+_TOP_ISSUES_FROM = """
+    SELECT je.value AS issue, COUNT(*) AS count
+    FROM evaluations e, json_each(e.issues_found) je
+    WHERE e.issues_found IS NOT NULL
+      AND e.issues_found <> '[]'
+      AND json_type(e.issues_found) = 'array'
+"""
+_TOP_ISSUES_TAIL = """
+    GROUP BY je.value
+    ORDER BY count DESC, MIN(e.id)
+    LIMIT :limit
+"""
+_TOP_ISSUES_SQL = text(_TOP_ISSUES_FROM + _TOP_ISSUES_TAIL)
+_TOP_ISSUES_BY_AGENT_SQL = text(_TOP_ISSUES_FROM + "  AND e.agent_type = :agent_type" + _TOP_ISSUES_TAIL)
+
+
+# Statements are built once at import with bind parameters, so each call
+# only binds values and hits SQLAlchemy's compiled-statement cache.
+# Newest first, with id breaking timestamp ties so pages are stable. Both
+# timestamp indexes end in the rowid (id), so SQLite walks them backwards
+# without a sort. Keyset pages continue strictly after the cursor row.
+_RECENT_ORDER = (Evaluation.evaluation_timestamp.desc(), Evaluation.id.desc())
+_RECENT_CURSOR = tuple_(Evaluation.evaluation_timestamp, Evaluation.id) < tuple_(
+    bindparam('before_ts', type_=Evaluation.evaluation_timestamp.type),
+    bindparam('before_id')
+)
+_RECENT_STMT = (
+    select(*EVALUATION_COLUMNS)
+    .order_by(*_RECENT_ORDER)
+    .limit(bindparam('limit'))
+)
+_RECENT_BY_AGENT_STMT = (
+    select(*EVALUATION_COLUMNS)
+    .where(Evaluation.agent_type == bindparam('agent_type'))
+    .order_by(*_RECENT_ORDER)
+    .limit(bindparam('limit'))
+)
+_RECENT_PAGE_STMT = _RECENT_STMT.where(_RECENT_CURSOR)
+_RECENT_PAGE_BY_AGENT_STMT = _RECENT_BY_AGENT_STMT.where(_RECENT_CURSOR)
+
+# Raw issues_found text for the Python fallback of get_top_issues
+_ISSUES_STMT = select(Evaluation.issues_found).where(Evaluation.issues_found.isnot(None))
+_ISSUES_BY_AGENT_STMT = _ISSUES_STMT.where(Evaluation.agent_type == bindparam('agent_type'))
+
+# Averages come back rounded from SQLite. NULLIF keeps the existing
+# contract that an all-zero (or empty) average is reported as None.
+_AVG_SCORES_STMT = (
+    select(
+        Evaluation.agent_type,  # Column to group by
+        func.round(func.nullif(func.avg(Evaluation.completeness_score), 0), 3).label('avg_completeness'),  # AVG() function
+        func.round(func.nullif(func.avg(Evaluation.accuracy_score), 0), 3).label('avg_accuracy'),
+        func.round(func.nullif(func.avg(Evaluation.consistency_score), 0), 3).label('avg_consistency'),
+        func.round(func.nullif(func.avg(Evaluation.overall_score), 0), 3).label('avg_overall'),
+        func.count(Evaluation.id).label('total_count')  # COUNT() function
+    )
+    .where(Evaluation.evaluation_ts_epoch >= bindparam('cutoff'))
+    .group_by(Evaluation.agent_type)
+)
+# Rounded in SQLite like _AVG_SCORES_STMT; a 0 average maps to None as before
+_TREND_STMT = (
+    select(
+        EvaluationSummary.summary_date,
+        func.round(func.nullif(EvaluationSummary.avg_overall_score, 0), 3).label('avg_score'),
+        EvaluationSummary.total_evaluations
+    )
+    .where(
+        and_(
+            EvaluationSummary.agent_type == bindparam('agent_type'),
+            EvaluationSummary.summary_date >= bindparam('cutoff', type_=EvaluationSummary.summary_date.type)
+        )
+    )
+    .order_by(EvaluationSummary.summary_date)
+)
+
+
+def _decoded_issue_lists(rows) -> Iterator[list]:
+    # issues_found values that decode to a JSON list of hashable entries;
+    # malformed rows and rows holding nested lists/objects are skipped
+    for (issues_json,) in rows:
+        if issues_json:
+            try:
+                issues = _json_loads(issues_json)
+                if isinstance(issues, list):
+                    hash(tuple(issues))
+                    yield issues
+            except (ValueError, TypeError):  # JSONDecodeError is a ValueError
+                continue
+
+
+# Short-lived memo of aggregate results, shared by every EvaluationQueries
+# in the process. Keys carry the database path and its evaluations_version,
+# so a write through DatabaseManager (bulk_insert_evaluations, an ORM session
+# from it, or refresh_summaries) makes earlier entries unreachable. Writes
+# from another process, or raw SQL run on the engine directly, don't bump the
+# version; those show up once the entry's TTL runs out.
+_RESULT_CACHE_TTL = 60.0  # Seconds
+_RESULT_CACHE_SIZE = 64
+_result_cache: "OrderedDict[tuple, Tuple[float, object]]" = OrderedDict()
+_result_cache_lock = threading.Lock()
 
 
 class EvaluationQueries:
@@ -11,100 +159,119 @@ class EvaluationQueries:
     def __init__(self, db_manager: DatabaseManager):
         self.db = db_manager
     
-    def get_recent_evaluations(self, agent_type: Optional[str] = None, limit: int = 100) -> List[Dict]:
-        session = self.db.get_session()
+    def get_recent_evaluations(
+        self,
+        agent_type: Optional[str] = None,
+        limit: int = 100,
+        before: Optional[Tuple[Union[datetime, str], int]] = None
+    ) -> List[Dict]:
+        # before=(evaluation_timestamp, id) of the last row already seen
+        # returns the next page.
+        session = self.db.Session()
         try:
-            query = session.query(Evaluation)
+            result = self._execute_recent(session, agent_type, limit, before)
             
-            if agent_type:
-                query = query.filter(Evaluation.agent_type == agent_type)
-            
-            query = query.order_by(Evaluation.evaluation_timestamp.desc()).limit(limit)
-            
-            return [e.to_dict() for e in query.all()]
+            return [evaluation_to_dict(row) for row in result]
         finally:
             session.close()
     
+    def _execute_recent(self, session, agent_type: Optional[str], limit: int, before):
+        # Plain column rows, not ORM instances: nothing to identity-map
+        # or track just to call to_dict() on
+        params = {'limit': limit}
+        if agent_type:
+            params['agent_type'] = agent_type
+        
+        if before is None:
+            stmt = _RECENT_BY_AGENT_STMT if agent_type else _RECENT_STMT
+        else:
+            before_ts, before_id = before
+            if isinstance(before_ts, str):
+                before_ts = datetime.fromisoformat(before_ts)  # As returned by to_dict()
+            params['before_ts'] = before_ts
+            params['before_id'] = before_id
+            stmt = _RECENT_PAGE_BY_AGENT_STMT if agent_type else _RECENT_PAGE_STMT
+        
+        return session.execute(stmt, params)
+    
     def get_avg_scores_by_agent(self, days: int = 7) -> List[Dict]:
-        session = self.db.get_session()
+        cached = self._cached_result(('avg_scores', days))
+        if cached is not None:
+            return [dict(r) for r in cached]
+        
+        session = self.db.Session()
         try:
-            cutoff_date = datetime.now() - timedelta(days=days)
-            
-            results = session.query(
-                Evaluation.agent_type,  # Column to group by
-                func.avg(Evaluation.completeness_score).label('avg_completeness'),  # AVG() function
-                func.avg(Evaluation.accuracy_score).label('avg_accuracy'),
-                func.avg(Evaluation.consistency_score).label('avg_consistency'),
-                func.avg(Evaluation.overall_score).label('avg_overall'),
-                func.count(Evaluation.id).label('total_count')  # COUNT() function
-            ).filter(
-                Evaluation.evaluation_timestamp >= cutoff_date
-            ).group_by(
-                Evaluation.agent_type
-            ).all()  # Execute query
-            
-            return [
-                {
-                    'agent_type': r.agent_type,
-                    'avg_completeness': round(r.avg_completeness, 3) if r.avg_completeness else None,
-                    'avg_accuracy': round(r.avg_accuracy, 3) if r.avg_accuracy else None,
-                    'avg_consistency': round(r.avg_consistency, 3) if r.avg_consistency else None,
-                    'avg_overall': round(r.avg_overall, 3) if r.avg_overall else None,
-                    'total_count': r.total_count
-                }
-                for r in results  # List comprehension - builds list from results
-            ]
+            result = self._fetch_avg_scores(session, days)
         finally:
             session.close()
+        
+        self._store_result(('avg_scores', days), result)
+        return [dict(r) for r in result]
     
     def get_quality_distribution(self, agent_type: Optional[str] = None) -> Dict:
-        session = self.db.get_session()
+        cached = self._cached_result(('quality_distribution', agent_type))
+        if cached is not None:
+            return dict(cached)
+        
+        session = self.db.Session()
         try:
-            query_text = """
-                SELECT 
-                    COUNT(*) as total,
-                    SUM(CASE WHEN overall_score >= 0.8 THEN 1 ELSE 0 END) as high_quality,
-                    SUM(CASE WHEN overall_score >= 0.5 AND overall_score < 0.8 THEN 1 ELSE 0 END) as medium_quality,
-                    SUM(CASE WHEN overall_score < 0.5 THEN 1 ELSE 0 END) as low_quality
-                FROM evaluations
-            """
-            
-            if agent_type:
-                query_text += " WHERE agent_type = :agent_type"
-            
-            result = session.execute(text(query_text), {"agent_type": agent_type} if agent_type else {})
-            row = result.fetchone()
-            
-            if row:
-                return {
-                    'total': row.total,
-                    'high_quality': row.high_quality,
-                    'medium_quality': row.medium_quality,
-                    'low_quality': row.low_quality
-                }
-            return {'total': 0, 'high_quality': 0, 'medium_quality': 0, 'low_quality': 0}
+            result = self._fetch_quality_distribution(session, agent_type)
         finally:
             session.close()
+        
+        self._store_result(('quality_distribution', agent_type), result)
+        return dict(result)
+    
+    def _cache_key(self, key: tuple) -> tuple:
+        return (str(self.db.db_path), self.db.evaluations_version) + key
+    
+    def _cached_result(self, key: tuple):
+        full_key = self._cache_key(key)
+        with _result_cache_lock:
+            entry = _result_cache.get(full_key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del _result_cache[full_key]
+                return None
+            _result_cache.move_to_end(full_key)
+            return value
+    
+    def cached_result(self, key: tuple, compute: Callable[[], Any]) -> Any:
+        # Memoizes a caller-built result (e.g. a whole report) in the same
+        # short-lived cache as the aggregate queries, so it is also dropped
+        # when evaluations are written. Callers get a deep copy.
+        value = self._cached_result(key)
+        if value is None:
+            value = compute()
+            self._store_result(key, value)
+        return copy.deepcopy(value)
+    
+    def _store_result(self, key: tuple, value):
+        # Callers always get copies, so the stored value is never mutated
+        with _result_cache_lock:
+            _result_cache[self._cache_key(key)] = (time.monotonic() + _RESULT_CACHE_TTL, value)
+            while len(_result_cache) > _RESULT_CACHE_SIZE:
+                _result_cache.popitem(last=False)
     
     def get_trend_over_time(self, agent_type: str, days: int = 7) -> List[Dict]:
-        """Get score trends over time using date grouping.
+        """Get score trends over time from the daily summary table.
         
         INTERVIEW EXPLANATION:
-        This groups evaluations by date and calculates daily averages.
-        Demonstrates time-series analysis:
-        - func.date() - Extract date from datetime (SQLite function)
-        - Group by date to get daily aggregates
-        - Order by date for chronological results
-        
-        Equivalent SQL:
-        SELECT 
-            DATE(evaluation_timestamp) as eval_date,
-            AVG(overall_score) as avg_score,
-            COUNT(id) as count
-        FROM evaluations
-        WHERE agent_type = ? AND evaluation_timestamp >= cutoff_date
-        GROUP BY DATE(evaluation_timestamp)
-        ORDER BY DATE(evaluation_timestamp)
+        Daily averages are materialized into evaluation_summary (one row per
+        agent and day, kept current by the trg_evaluations_summary_insert
+        trigger as evaluations are inserted), so this is an indexed lookup
+        over at most `days` rows instead of a GROUP BY over every raw
+        evaluation:
+        
+        SELECT summary_date, avg_overall_score, total_evaluations
+        FROM evaluation_summary
+        WHERE agent_type = ? AND summary_date >= cutoff_date
+        ORDER BY summary_date
+        
+        Whole days are reported: the oldest day in the window covers all of
+        that day's evaluations.
         
         Args:
             agent_type: Agent type to analyze
@@ -113,50 +280,85 @@ class EvaluationQueries:
         Returns:
             List of dictionaries with daily averages
         """
-        session = self.db.get_session()
+        session = self.db.Session()
         try:
-            cutoff_date = datetime.now() - timedelta(days=days)
-            
-            results = session.query(
-                func.date(Evaluation.evaluation_timestamp).label('eval_date'),
-                func.avg(Evaluation.overall_score).label('avg_score'),
-                func.count(Evaluation.id).label('count')
-            ).filter(
-                and_(
-                    Evaluation.agent_type == agent_type,
-                    Evaluation.evaluation_timestamp >= cutoff_date
-                )
-            ).group_by(
-                func.date(Evaluation.evaluation_timestamp)
-            ).order_by(
-                func.date(Evaluation.evaluation_timestamp)
-            ).all()
-            
-            return [
-                {
-                    'date': str(r.eval_date),
-                    'avg_score': round(r.avg_score, 3) if r.avg_score else None,
-                    'count': r.count
-                }
-                for r in results
-            ]
+            return self._fetch_trend(session, agent_type, days)
         finally:
             session.close()
     
+    def dashboard_snapshot(
+        self,
+        agent_type: Optional[str] = None,
+        days: int = 7,
+        trend_agent_types: Optional[List[str]] = None
+    ) -> Dict:
+        # Average scores, quality distribution and daily trends read over one
+        # connection and one transaction instead of a session per query.
+        # Trends are keyed by agent: agent_type if given, else trend_agent_types.
+        if agent_type:
+            trend_agent_types = [agent_type]
+        
+        with self.db.engine.connect() as conn:
+            return {
+                'avg': self._fetch_avg_scores(conn, days),
+                'dist': self._fetch_quality_distribution(conn, agent_type),
+                'trend': {
+                    agent: self._fetch_trend(conn, agent, days)
+                    for agent in (trend_agent_types or [])
+                }
+            }
+    
+    def _fetch_avg_scores(self, conn, days: int) -> List[Dict]:
+        cutoff_epoch = _epoch_cutoff(days)
+        
+        results = conn.execute(_AVG_SCORES_STMT, {'cutoff': cutoff_epoch}).mappings()
+        
+        return [dict(r) for r in results]
+    
+    def _fetch_quality_distribution(self, conn, agent_type: Optional[str]) -> Dict:
+        if agent_type:
+            result = conn.execute(_QUALITY_DISTRIBUTION_BY_AGENT_SQL, {"agent_type": agent_type})
+        else:
+            result = conn.execute(_QUALITY_DISTRIBUTION_SQL)
+        
+        # An aggregate without GROUP BY always yields exactly one row, and the
+        # SQL aliases and COALESCE defaults already give the returned shape
+        return dict(result.mappings().one())
+    
+    def _fetch_trend(self, conn, agent_type: str, days: int) -> List[Dict]:
+        cutoff_date = (datetime.now() - timedelta(days=days)).date()
+        
+        results = conn.execute(
+            _TREND_STMT, {'agent_type': agent_type, 'cutoff': cutoff_date}
+        ).all()
+        
+        return [
+            {
+                'date': str(r.summary_date),
+                'avg_score': r.avg_score,
+                'count': r.total_evaluations
+            }
+            for r in results
+        ]
+    
     def get_top_issues(self, agent_type: Optional[str] = None, limit: int = 10) -> List[Dict]:
         """Analyze issues_found JSON to find most common issues.
         
         INTERVIEW EXPLANATION:
-        This demonstrates JSON processing in Python (since SQLite has limited JSON support).
-        Process:
-        1. Query all issues_found JSON strings
-        2. Parse each JSON string to Python list
-        3. Combine all issues into one list
-        4. Count frequency of each issue
-        5. Return most common issues
+        SQLite's JSON1 json_each() table-valued function unnests each
+        issues_found array into one row per issue, so the counting happens
+        inside the database engine:
         
-        In PostgreSQL, you could use JSON functions directly in SQL.
-        For SQLite, we process JSON in Python.
+        SELECT je.value AS issue, COUNT(*) AS count
+        FROM evaluations e, json_each(e.issues_found) je
+        WHERE e.issues_found IS NOT NULL AND e.issues_found <> '[]'
+          AND json_type(e.issues_found) = 'array'
+        GROUP BY je.value
+        ORDER BY count DESC
+        LIMIT ?
+        
+        If any stored value is malformed JSON, json_each raises and we fall
+        back to parsing the rows in Python.
         
         Args:
             agent_type: Optional filter by agent type
@@ -165,40 +367,47 @@ class EvaluationQueries:
         Returns:
             List of dictionaries with issue and count, sorted by count (descending)
         """
-        session = self.db.get_session()
+        session = self.db.Session()
         try:
-            query = session.query(Evaluation.issues_found)
-            
             if agent_type:
-                query = query.filter(Evaluation.agent_type == agent_type)
+                stmt = _TOP_ISSUES_BY_AGENT_SQL
+                params = {"agent_type": agent_type, "limit": limit}
+            else:
+                stmt = _TOP_ISSUES_SQL
+                params = {"limit": limit}
             
-            # Filter out None values
-            query = query.filter(Evaluation.issues_found.isnot(None))
-            
-            rows = query.all()
-            
-            # Count issues
-            issue_counts = {}
-            for row in rows:
-                if row.issues_found:
-                    try:
-                        issues = json.loads(row.issues_found)
-                        if isinstance(issues, list):
-                            for issue in issues:
-                                issue_counts[issue] = issue_counts.get(issue, 0) + 1
-                    except (json.JSONDecodeError, TypeError):
-                        continue
-            
-            # Sort by count descending and return top N
-            sorted_issues = sorted(
-                issue_counts.items(),
-                key=lambda x: x[1],
-                reverse=True
-            )[:limit]
+            try:
+                rows = session.execute(stmt, params).fetchall()
+            except OperationalError as e:
+                logger.warning(f"json_each aggregation failed ({e.orig}), counting issues in Python")
+                session.rollback()
+                return self._count_top_issues_python(session, agent_type, limit)
             
             return [
-                {'issue': issue, 'count': count}
-                for issue, count in sorted_issues
+                {'issue': row.issue, 'count': row.count}
+                for row in rows
             ]
         finally:
-            session.close()
\ No newline at end of file
+            session.close()
+    
+    def _count_top_issues_python(self, session, agent_type: Optional[str], limit: int) -> List[Dict]:
+        # Stream just the TEXT column in batches rather than materializing
+        # every row up front
+        if agent_type:
+            rows = session.execute(
+                _ISSUES_BY_AGENT_STMT, {'agent_type': agent_type}, execution_options={'yield_per': 1000}
+            )
+        else:
+            rows = session.execute(_ISSUES_STMT, execution_options={'yield_per': 1000})
+        
+        # One Counter() call over every decoded issue, still streamed: the
+        # per-issue increments run in C without an update() call per row
+        issue_counts = Counter(chain.from_iterable(_decoded_issue_lists(rows)))
+        
+        # Top N by count; nlargest keeps first-seen order on ties like sorted()
+        top_issues = heapq.nlargest(limit, issue_counts.items(), key=itemgetter(1))
+        
+        return [
+            {'issue': issue, 'count': count}
+            for issue, count in top_issues
+        ]
@@ -11,6 +11,9 @@ CREATE TABLE IF NOT EXISTS evaluations (
     agent_type VARCHAR(50) NOT NULL,  -- 'collector', 'cleaner', 'labeler'
     symbol VARCHAR(10),
     evaluation_timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    -- Unix seconds for integer range filters (timestamp read as UTC)
+    evaluation_ts_epoch BIGINT GENERATED ALWAYS AS (CAST(strftime('%s', evaluation_timestamp) AS INTEGER)) VIRTUAL,
+    eval_date DATE GENERATED ALWAYS AS (date(evaluation_timestamp)) VIRTUAL,
     
     -- Data quality metrics (scores from 0.0 to 1.0)
     completeness_score FLOAT CHECK(completeness_score >= 0 AND completeness_score <= 1),
@@ -18,13 +21,13 @@ CREATE TABLE IF NOT EXISTS evaluations (
     consistency_score FLOAT CHECK(consistency_score >= 0 AND consistency_score <= 1),
     overall_score FLOAT CHECK(overall_score >= 0 AND overall_score <= 1),
     
-    -- Detailed metrics (JSON format stored as TEXT in SQLite)
-    metrics_json TEXT,
+    -- Detailed metrics (JSON, deflate-packed into a BLOB; see PackedJSONText)
+    metrics_json BLOB,
     
-    -- Evaluation details (JSON arrays stored as TEXT)
-    evaluated_fields TEXT,  -- JSON array of fields evaluated
+    -- Evaluation details (JSON arrays; issues_found stays TEXT for json_each)
+    evaluated_fields BLOB,  -- JSON array of fields evaluated, deflate-packed
     issues_found TEXT,      -- JSON array of issues
-    recommendations TEXT,   -- JSON array of recommendations
+    recommendations BLOB,   -- JSON array of recommendations, deflate-packed
     
     -- Metadata
     pipeline_run_id VARCHAR(100),
@@ -34,7 +37,6 @@ CREATE TABLE IF NOT EXISTS evaluations (
 
 -- Evaluation summary table: Daily/aggregated metrics
 CREATE TABLE IF NOT EXISTS evaluation_summary (
-    id INTEGER PRIMARY KEY AUTOINCREMENT,
     agent_type VARCHAR(50) NOT NULL,
     summary_date DATE NOT NULL,
     
@@ -44,17 +46,27 @@ CREATE TABLE IF NOT EXISTS evaluation_summary (
     avg_consistency FLOAT,
     avg_overall_score FLOAT,
     
+    -- Running sums and non-NULL counts behind the averages
+    completeness_sum FLOAT DEFAULT 0,
+    accuracy_sum FLOAT DEFAULT 0,
+    consistency_sum FLOAT DEFAULT 0,
+    overall_sum FLOAT DEFAULT 0,
+    completeness_count INTEGER DEFAULT 0,
+    accuracy_count INTEGER DEFAULT 0,
+    consistency_count INTEGER DEFAULT 0,
+    overall_count INTEGER DEFAULT 0,
+    
     -- Counts
     total_evaluations INTEGER DEFAULT 0,
-    high_quality_count INTEGER DEFAULT 0,  -- overall_score > 0.8
-    medium_quality_count INTEGER DEFAULT 0, -- 0.5 <= overall_score <= 0.8
+    high_quality_count INTEGER DEFAULT 0,  -- overall_score >= 0.8
+    medium_quality_count INTEGER DEFAULT 0, -- 0.5 <= overall_score < 0.8
     low_quality_count INTEGER DEFAULT 0,   -- overall_score < 0.5
     
     -- Common issues (JSON)
     top_issues TEXT,
     
-    UNIQUE(agent_type, summary_date)
-);
+    PRIMARY KEY (agent_type, summary_date)
+) WITHOUT ROWID;
 
 -- Pipeline runs tracking
 CREATE TABLE IF NOT EXISTS pipeline_runs (
@@ -69,10 +81,65 @@ CREATE TABLE IF NOT EXISTS pipeline_runs (
 
 -- Indexes for performance (make queries faster)
 CREATE INDEX IF NOT EXISTS idx_evaluations_agent_type ON evaluations(agent_type);
+CREATE INDEX IF NOT EXISTS idx_evaluations_agent_ts ON evaluations(agent_type, evaluation_timestamp);
 CREATE INDEX IF NOT EXISTS idx_evaluations_timestamp ON evaluations(evaluation_timestamp);
+CREATE INDEX IF NOT EXISTS idx_evaluations_agent_epoch_scores ON evaluations(
+    agent_type, evaluation_ts_epoch, completeness_score, accuracy_score, consistency_score, overall_score
+);
+CREATE INDEX IF NOT EXISTS idx_evaluations_epoch ON evaluations(evaluation_ts_epoch);
+CREATE INDEX IF NOT EXISTS idx_evaluations_agent_date ON evaluations(agent_type, eval_date);
+CREATE INDEX IF NOT EXISTS idx_evaluations_overall_score ON evaluations(overall_score);
+CREATE INDEX IF NOT EXISTS idx_evaluations_pipeline_run ON evaluations(pipeline_run_id);
 CREATE INDEX IF NOT EXISTS idx_evaluations_symbol ON evaluations(symbol);
+CREATE INDEX IF NOT EXISTS idx_eval_issues_notnull ON evaluations(agent_type) WHERE issues_found IS NOT NULL AND issues_found <> '[]';
 CREATE INDEX IF NOT EXISTS idx_evaluation_summary_date ON evaluation_summary(summary_date);
-CREATE INDEX IF NOT EXISTS idx_evaluation_summary_agent ON evaluation_summary(agent_type, summary_date);
+
+-- Keep evaluation_summary current as evaluations are inserted
+CREATE TRIGGER IF NOT EXISTS trg_evaluations_summary_insert
+AFTER INSERT ON evaluations
+WHEN NEW.evaluation_timestamp IS NOT NULL
+BEGIN
+    INSERT INTO evaluation_summary (
+        agent_type, summary_date,
+        avg_completeness, avg_accuracy, avg_consistency, avg_overall_score,
+        completeness_sum, accuracy_sum, consistency_sum, overall_sum,
+        completeness_count, accuracy_count, consistency_count, overall_count,
+        total_evaluations, high_quality_count, medium_quality_count, low_quality_count
+    )
+    VALUES (
+        NEW.agent_type, date(NEW.evaluation_timestamp),
+        NEW.completeness_score, NEW.accuracy_score, NEW.consistency_score, NEW.overall_score,
+        IFNULL(NEW.completeness_score, 0), IFNULL(NEW.accuracy_score, 0),
+        IFNULL(NEW.consistency_score, 0), IFNULL(NEW.overall_score, 0),
+        NEW.completeness_score IS NOT NULL, NEW.accuracy_score IS NOT NULL,
+        NEW.consistency_score IS NOT NULL, NEW.overall_score IS NOT NULL,
+        1,
+        IFNULL(NEW.overall_score >= 0.8, 0),
+        IFNULL(NEW.overall_score >= 0.5 AND NEW.overall_score < 0.8, 0),
+        IFNULL(NEW.overall_score < 0.5, 0)
+    )
+    ON CONFLICT (agent_type, summary_date) DO UPDATE SET
+        completeness_sum = completeness_sum + excluded.completeness_sum,
+        accuracy_sum = accuracy_sum + excluded.accuracy_sum,
+        consistency_sum = consistency_sum + excluded.consistency_sum,
+        overall_sum = overall_sum + excluded.overall_sum,
+        completeness_count = completeness_count + excluded.completeness_count,
+        accuracy_count = accuracy_count + excluded.accuracy_count,
+        consistency_count = consistency_count + excluded.consistency_count,
+        overall_count = overall_count + excluded.overall_count,
+        avg_completeness = (completeness_sum + excluded.completeness_sum)
+            / NULLIF(completeness_count + excluded.completeness_count, 0),
+        avg_accuracy = (accuracy_sum + excluded.accuracy_sum)
+            / NULLIF(accuracy_count + excluded.accuracy_count, 0),
+        avg_consistency = (consistency_sum + excluded.consistency_sum)
+            / NULLIF(consistency_count + excluded.consistency_count, 0),
+        avg_overall_score = (overall_sum + excluded.overall_sum)
+            / NULLIF(overall_count + excluded.overall_count, 0),
+        total_evaluations = total_evaluations + 1,
+        high_quality_count = high_quality_count + excluded.high_quality_count,
+        medium_quality_count = medium_quality_count + excluded.medium_quality_count,
+        low_quality_count = low_quality_count + excluded.low_quality_count;
+END;
 
 -- ============================================================
 -- PRODUCT ANALYTICS TABLES
@@ -161,6 +228,7 @@ CREATE TABLE IF NOT EXISTS anomalies (
 -- Indexes for anomaly queries
 CREATE INDEX IF NOT EXISTS idx_anomalies_agent_type ON anomalies(agent_type);
 CREATE INDEX IF NOT EXISTS idx_anomalies_timestamp ON anomalies(detection_timestamp);
+CREATE INDEX IF NOT EXISTS idx_anomalies_agent_ts ON anomalies(agent_type, detection_timestamp);
 CREATE INDEX IF NOT EXISTS idx_anomalies_severity ON anomalies(severity);
 CREATE INDEX IF NOT EXISTS idx_anomalies_status ON anomalies(status);
 CREATE INDEX IF NOT EXISTS idx_anomalies_check_run ON anomalies(check_run_id);
@@ -1,182 +1,263 @@
 
 import sys
+import argparse
 from pathlib import Path
+from typing import Iterable, List, Optional
 
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-from agents.collector_agent import CollectorAgent
-from agents.cleaner_agent import CleanerAgent
-from agents.labeler_agent import LabelerAgent
-from agents.evaluator_agent import EvaluatorAgent
-from agents.anomaly_agent import AnomalyAgent
-from analytics.event_tracker import EventTracker
-from utils.logger import setup_logger
+# Agents are imported inside the phase that uses them: they pull in pandas,
+# SQLAlchemy and requests, so a run that stops early never pays for the rest.
+from utils.logger import setup_logger, configure_logging
 
 logger = setup_logger(__name__)
 
+PHASES = ('collect', 'clean', 'label', 'evaluate', 'anomaly')
 
-def main():
-    logger.info("=" * 60)
-    logger.info("DonutAI - Complete Crypto Data Pipeline")
-    logger.info("Phase 1: Collection → Phase 2: Cleaning → Phase 3: Labeling → Phase 4: Evaluation → Phase 5: Anomaly Detection")
-    logger.info("=" * 60)
+BAR = "=" * 60
+
+
+def _has_input_files(directory: Path) -> bool:
+    # Same selection as the agents' directory scans, stopping at the first hit
+    return any(
+        not f.name.startswith("all_coins")
+        for f in directory.glob("*.json")
+    )
+
+
+def _log_banner(*lines: str):
+    # One log record per banner instead of one per line
+    logger.info("\n".join((BAR, *lines, BAR)))
+
+
+def parse_phases(spec: str) -> List[str]:
+    # Shared by --phases here and in `donutai pipeline`: items are stripped,
+    # empty items dropped, and the result must name at least one known phase
+    phases = [p.strip() for p in spec.split(',') if p.strip()]
+    if not phases:
+        raise ValueError(f"No phases selected. Choose from {', '.join(PHASES)}")
+    unknown = sorted(set(phases) - set(PHASES))
+    if unknown:
+        raise ValueError(f"Unknown phases: {', '.join(unknown)}. Choose from {', '.join(PHASES)}")
+    return phases
+
+
+def main(phases: Optional[Iterable[str]] = None):
+    # phases selects a subset of PHASES (default: all); the rest are not
+    # run, and their agents are never imported
+    selected = set(PHASES if phases is None else phases)
+    if not selected:
+        raise ValueError(f"No phases selected. Choose from {', '.join(PHASES)}")
+    unknown = selected - set(PHASES)
+    if unknown:
+        raise ValueError(f"Unknown phases: {', '.join(sorted(unknown))}. Choose from {', '.join(PHASES)}")
+    
+    _log_banner(
+        "DonutAI - Complete Crypto Data Pipeline",
+        "Phase 1: Collection → Phase 2: Cleaning → Phase 3: Labeling → Phase 4: Evaluation → Phase 5: Anomaly Detection",
+        "Running phases: " + ", ".join(p for p in PHASES if p in selected),
+    )
     
     tracker = None
     session_id = None
     
     try:
+        from analytics.event_tracker import EventTracker
+        
         tracker = EventTracker()
         session_id = tracker.start_pipeline_session()
-        logger.info("\n" + "=" * 60)
-        logger.info("PHASE 1: DATA COLLECTION")
-        logger.info("=" * 60)
-        
-        collector_agent = CollectorAgent()
-        collected_data = collector_agent.collect_all(save_to_file=True)
-        
-        if not collected_data:
-            logger.error("No data collected. Cannot proceed with cleaning and labeling.")
-            if tracker and session_id:
-                tracker.complete_pipeline_session(session_id, 'failed')
-                tracker.close()
-            return 1
-        
-        tracker.track_phase_completion(
-            session_id,
-            'collection',
-            metadata={'coins_count': len(collected_data)}
-        )
-        
-        print(f"\n✅ Phase 1 Complete: Collected {len(collected_data)} coins")
-        
-        logger.info("\n" + "=" * 60)
-        logger.info("PHASE 2: DATA CLEANING")
-        logger.info("=" * 60)
-        
-        cleaner_agent = CleanerAgent()
-        cleaned_data = cleaner_agent.clean_all_raw_files(save_to_file=True)
-        
-        if not cleaned_data:
-            logger.warning("No data cleaned. Proceeding with available data.")
-        
-        cleaner_stats = cleaner_agent.get_stats()
-        tracker.track_phase_completion(
-            session_id,
-            'cleaning',
-            metadata={'files_cleaned': cleaner_stats.get('files_cleaned', len(cleaned_data))}
-        )
-        
-        print(f"✅ Phase 2 Complete: Cleaned {len(cleaned_data)} records")
-        
-        logger.info("\n" + "=" * 60)
-        logger.info("PHASE 3: DATA LABELING")
-        logger.info("=" * 60)
-        
-        labeler_agent = LabelerAgent()
-        labeled_data = labeler_agent.label_all_cleaned_files(save_to_file=True)
-        
-        if not labeled_data:
-            logger.warning("No data labeled.")
-        
-        labeler_stats = labeler_agent.get_stats()
-        tracker.track_phase_completion(
-            session_id,
-            'labeling',
-            metadata={'records_labeled': labeler_stats.get('records_labeled', len(labeled_data))}
-        )
-        
-        print(f"✅ Phase 3 Complete: Labeled {len(labeled_data)} records")
-        
-        logger.info("\n" + "=" * 60)
-        logger.info("PHASE 4: DATA EVALUATION (Critic Agent)")
-        logger.info("=" * 60)
-        
-        evaluator_agent = EvaluatorAgent()
-        evaluation_results = evaluator_agent.evaluate_all_pipeline_outputs()
-        
-        collector_evals = len(evaluation_results.get('collector_evaluations', []))
-        cleaner_evals = len(evaluation_results.get('cleaner_evaluations', []))
-        labeler_evals = len(evaluation_results.get('labeler_evaluations', []))
-        
-        evaluator_stats = evaluator_agent.get_stats()
-        
-        tracker.track_phase_completion(
-            session_id,
-            'evaluation',
-            metadata={'evaluations_performed': evaluator_stats.get('evaluations_performed', 0)}
-        )
-        
-        print(f"✅ Phase 4 Complete: Evaluated pipeline outputs")
-        print(f"  - Collector evaluations: {collector_evals}")
-        print(f"  - Cleaner evaluations: {cleaner_evals}")
-        print(f"  - Labeler evaluations: {labeler_evals}")
-        print(f"  - Evaluation data saved to: data/evaluations.db")
-        
-        evaluator_agent.close()
-        
-        logger.info("\n" + "=" * 60)
-        logger.info("PHASE 5: ANOMALY DETECTION & ALERTING")
-        logger.info("=" * 60)
-        
-        anomaly_agent = AnomalyAgent()
-        anomaly_results = anomaly_agent.check_all_metrics(
-            threshold=0.7,  # Alert if quality score drops below 70%
-            lookback_days=7,  # Compare to last 7 days
-            send_alerts=True
-        )
-        
-        anomalies_found = anomaly_results.get('anomalies_found', 0)
-        critical_anomalies = anomaly_results.get('critical_anomalies', 0)
-        
-        anomaly_stats = anomaly_agent.get_stats()
-        anomaly_agent.close()
-        
-        print(f"✅ Phase 5 Complete: Anomaly detection performed")
-        print(f"  - Anomalies detected: {anomalies_found}")
-        print(f"  - Critical anomalies: {critical_anomalies}")
-        print(f"  - Alerts sent: {anomaly_stats.get('alerts_sent', 0)}")
-        
-        if anomalies_found > 0:
-            print(f"  ⚠️  WARNING: {anomalies_found} anomaly(ies) detected - check logs for details")
-        else:
-            print(f"  ✅ No anomalies detected - all metrics are healthy")
         
+        from config.settings import RAW_DATA_DIR, CLEANED_DATA_DIR
+        
+        if 'collect' in selected:
+            _log_banner("PHASE 1: DATA COLLECTION")
+            
+            from agents.collector_agent import CollectorAgent
+            
+            collector_agent = CollectorAgent()
+            collected_data = collector_agent.collect_all(save_to_file=True)
+            
+            if not collected_data:
+                logger.error("No data collected. Cannot proceed with cleaning and labeling.")
+                if tracker and session_id:
+                    tracker.complete_pipeline_session(session_id, 'failed')
+                    tracker.close()
+                return 1
+            
+            collector_stats = collector_agent.get_stats()
+            tracker.track_phase_completion(
+                session_id,
+                'collection',
+                metadata={'coins_count': len(collected_data)}
+            )
+            
+            print(f"\n✅ Phase 1 Complete: Collected {len(collected_data)} coins")
+            
+        if 'clean' in selected:
+            _log_banner("PHASE 2: DATA CLEANING")
+            
+            if _has_input_files(RAW_DATA_DIR):
+                from agents.cleaner_agent import CleanerAgent
+                
+                cleaner_agent = CleanerAgent()
+                cleaned_data = cleaner_agent.clean_all_raw_files(save_to_file=True)
+                cleaner_stats = cleaner_agent.get_stats()
+            else:
+                logger.warning("No raw files in %s. Skipping cleaning.", RAW_DATA_DIR)
+                cleaned_data = []
+                cleaner_stats = {'files_cleaned': 0, 'skipped': True}
+            
+            if not cleaned_data:
+                logger.warning("No data cleaned. Proceeding with available data.")
+            
+            tracker.track_phase_completion(
+                session_id,
+                'cleaning',
+                metadata={
+                    'files_cleaned': cleaner_stats.get('files_cleaned', len(cleaned_data)),
+                    'skipped': cleaner_stats.get('skipped', False)
+                }
+            )
+            
+            print(f"✅ Phase 2 Complete: Cleaned {len(cleaned_data)} records")
+            
+        if 'label' in selected:
+            _log_banner("PHASE 3: DATA LABELING")
+            
+            if _has_input_files(CLEANED_DATA_DIR):
+                from agents.labeler_agent import LabelerAgent
+                
+                labeler_agent = LabelerAgent()
+                labeled_data = labeler_agent.label_all_cleaned_files(save_to_file=True)
+                labeler_stats = labeler_agent.get_stats()
+            else:
+                logger.warning("No cleaned files in %s. Skipping labeling.", CLEANED_DATA_DIR)
+                labeled_data = []
+                labeler_stats = {'records_labeled': 0, 'skipped': True}
+            
+            if not labeled_data:
+                logger.warning("No data labeled.")
+            
+            tracker.track_phase_completion(
+                session_id,
+                'labeling',
+                metadata={
+                    'records_labeled': labeler_stats.get('records_labeled', len(labeled_data)),
+                    'skipped': labeler_stats.get('skipped', False)
+                }
+            )
+            
+            print(f"✅ Phase 3 Complete: Labeled {len(labeled_data)} records")
+            
+        if 'evaluate' in selected:
+            _log_banner("PHASE 4: DATA EVALUATION (Critic Agent)")
+            
+            from agents.evaluator_agent import EvaluatorAgent
+            
+            evaluator_agent = EvaluatorAgent()
+            evaluation_results = evaluator_agent.evaluate_all_pipeline_outputs()
+            
+            collector_evals = len(evaluation_results.get('collector_evaluations', []))
+            cleaner_evals = len(evaluation_results.get('cleaner_evaluations', []))
+            labeler_evals = len(evaluation_results.get('labeler_evaluations', []))
+            
+            evaluator_stats = evaluator_agent.get_stats()
+            
+            tracker.track_phase_completion(
+                session_id,
+                'evaluation',
+                metadata={'evaluations_performed': evaluator_stats.get('evaluations_performed', 0)}
+            )
+            
+            print(f"✅ Phase 4 Complete: Evaluated pipeline outputs")
+            print(f"  - Collector evaluations: {collector_evals}")
+            print(f"  - Cleaner evaluations: {cleaner_evals}")
+            print(f"  - Labeler evaluations: {labeler_evals}")
+            print(f"  - Evaluation data saved to: data/evaluations.db")
+            
+            evaluator_agent.close()
+            
+        if 'anomaly' in selected:
+            _log_banner("PHASE 5: ANOMALY DETECTION & ALERTING")
+            
+            from agents.anomaly_agent import AnomalyAgent
+            
+            anomaly_agent = AnomalyAgent()
+            anomaly_results = anomaly_agent.check_all_metrics(
+                threshold=0.7,  # Alert if quality score drops below 70%
+                lookback_days=7,  # Compare to last 7 days
+                send_alerts=True
+            )
+            
+            anomalies_found = anomaly_results.get('anomalies_found', 0)
+            critical_anomalies = anomaly_results.get('critical_anomalies', 0)
+            
+            anomaly_stats = anomaly_agent.get_stats()
+            anomaly_agent.close()
+            
+            print(f"✅ Phase 5 Complete: Anomaly detection performed")
+            print(f"  - Anomalies detected: {anomalies_found}")
+            print(f"  - Critical anomalies: {critical_anomalies}")
+            print(f"  - Alerts sent: {anomaly_stats.get('alerts_sent', 0)}")
+            
+            if anomalies_found > 0:
+                print(f"  ⚠️  WARNING: {anomalies_found} anomaly(ies) detected - check logs for details")
+            else:
+                print(f"  ✅ No anomalies detected - all metrics are healthy")
+            
         tracker.complete_pipeline_session(session_id, 'completed')
         tracker.close()
         
-        print("\n" + "=" * 60)
-        print("PIPELINE COMPLETE")
-        print("=" * 60)
-        print(f"\nPhase 1 - Collection:")
-        collector_stats = collector_agent.get_stats()
-        print(f"  - Collected: {collector_stats['successful']} coins")
-        print(f"  - Data saved to: data/raw/")
-        
-        print(f"\nPhase 2 - Cleaning:")
-        cleaner_stats = cleaner_agent.get_stats()
-        print(f"  - Cleaned: {cleaner_stats['files_cleaned']} files")
-        print(f"  - Data saved to: data/cleaned/")
-        
-        print(f"\nPhase 3 - Labeling:")
-        labeler_stats = labeler_agent.get_stats()
-        print(f"  - Labeled: {labeler_stats['records_labeled']} records")
-        print(f"  - Data saved to: data/labeled/")
-        
-        print(f"\nPhase 4 - Evaluation (Critic Agent):")
-        print(f"  - Evaluations performed: {evaluator_stats.get('evaluations_performed', 0)}")
-        print(f"  - High quality: {evaluator_stats.get('high_quality_count', 0)}")
-        print(f"  - Medium quality: {evaluator_stats.get('medium_quality_count', 0)}")
-        print(f"  - Low quality: {evaluator_stats.get('low_quality_count', 0)}")
-        print(f"  - Evaluation database: data/evaluations.db")
-        
-        print(f"\nPhase 5 - Anomaly Detection:")
-        print(f"  - Anomalies detected: {anomalies_found}")
-        print(f"  - Critical anomalies: {critical_anomalies}")
-        print(f"  - Checks performed: {anomaly_stats.get('anomaly_checks_performed', 0)}")
-        print(f"  - Alerts sent: {anomaly_stats.get('alerts_sent', 0)}")
-        
-        print("\n" + "=" * 60)
+        # Summary is assembled first and written with a single print
+        lines = ["", BAR, "PIPELINE COMPLETE", BAR]
+        if 'collect' in selected:
+            lines.extend([
+                "",
+                "Phase 1 - Collection:",
+                f"  - Collected: {collector_stats['successful']} coins",
+                "  - Data saved to: data/raw/",
+            ])
+        
+        if 'clean' in selected:
+            lines.extend([
+                "",
+                "Phase 2 - Cleaning:",
+                f"  - Cleaned: {cleaner_stats['files_cleaned']} files",
+                "  - Data saved to: data/cleaned/",
+            ])
+        
+        if 'label' in selected:
+            lines.extend([
+                "",
+                "Phase 3 - Labeling:",
+                f"  - Labeled: {labeler_stats['records_labeled']} records",
+                "  - Data saved to: data/labeled/",
+            ])
+        
+        if 'evaluate' in selected:
+            lines.extend([
+                "",
+                "Phase 4 - Evaluation (Critic Agent):",
+                f"  - Evaluations performed: {evaluator_stats.get('evaluations_performed', 0)}",
+                f"  - High quality: {evaluator_stats.get('high_quality_count', 0)}",
+                f"  - Medium quality: {evaluator_stats.get('medium_quality_count', 0)}",
+                f"  - Low quality: {evaluator_stats.get('low_quality_count', 0)}",
+                "  - Evaluation database: data/evaluations.db",
+            ])
+        
+        if 'anomaly' in selected:
+            lines.extend([
+                "",
+                "Phase 5 - Anomaly Detection:",
+                f"  - Anomalies detected: {anomalies_found}",
+                f"  - Critical anomalies: {critical_anomalies}",
+                f"  - Checks performed: {anomaly_stats.get('anomaly_checks_performed', 0)}",
+                f"  - Alerts sent: {anomaly_stats.get('alerts_sent', 0)}",
+            ])
+        
+        lines.extend(["", BAR])
+        print("\n".join(lines))
         
         return 0  # Success exit code
         
@@ -188,14 +269,30 @@ def main():
         return 130  # Standard exit code for Ctrl+C
         
     except Exception as e:
-        logger.error(f"Fatal error: {e}", exc_info=True)
+        logger.error("Fatal error: %s", e, exc_info=True)
         if tracker and session_id:
             tracker.complete_pipeline_session(session_id, 'failed')
             tracker.close()
         return 1  # Error exit code
 
 
+def _parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Run the DonutAI crypto data pipeline")
+    parser.add_argument(
+        '--phases',
+        default=','.join(PHASES),
+        help=f"Comma-separated phases to run (default: {','.join(PHASES)})"
+    )
+    args = parser.parse_args(argv)
+    
+    try:
+        return parse_phases(args.phases)
+    except ValueError as e:
+        parser.error(str(e))
+
+
 if __name__ == "__main__":
-    exit_code = main()
+    configure_logging()
+    exit_code = main(_parse_args())
     sys.exit(exit_code)
 
@@ -6,13 +6,21 @@ from datetime import datetime
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from analytics.evaluation_analyzer import EvaluationAnalyzer
 from utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+QUALITY_BANDS = (
+    ('high_quality', "High Quality (>0.8):  "),
+    ('medium_quality', "Medium Quality (0.5-0.8):"),
+    ('low_quality', "Low Quality (<0.5):   "),
+)
+
 
 def main():
+    # Imported here so loading this module doesn't pull in SQLAlchemy/pandas
+    from analytics.evaluation_analyzer import EvaluationAnalyzer
+    
     analyzer = EvaluationAnalyzer()
     
     try:
@@ -45,12 +53,9 @@ def main():
         total = dist.get('total', 0)
         if total > 0:
             print(f"  Total Evaluations: {total}")
-            print(f"  High Quality (>0.8):   {dist.get('high_quality', 0):4} "
-                  f"({(dist.get('high_quality', 0)/total*100):5.1f}%)")
-            print(f"  Medium Quality (0.5-0.8): {dist.get('medium_quality', 0):4} "
-                  f"({(dist.get('medium_quality', 0)/total*100):5.1f}%)")
-            print(f"  Low Quality (<0.5):    {dist.get('low_quality', 0):4} "
-                  f"({(dist.get('low_quality', 0)/total*100):5.1f}%)")
+            for key, label in QUALITY_BANDS:
+                count = dist.get(key, 0)
+                print(f"  {label} {count:4} ({count / total * 100:5.1f}%)")
         else:
             print("  No evaluation data found")
         
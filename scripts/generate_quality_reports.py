@@ -6,7 +6,15 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 import json
-from core.data_standards import DataDictionary
+
+try:
+    import orjson as _json_impl
+    _USE_ORJSON = True
+except ImportError:
+    _json_impl = json
+    _USE_ORJSON = False
+
+from core.data_standards import get_data_dictionary
 from analytics.data_quality_reporter import DataQualityReporter
 from config.settings import LABELED_DATA_DIR, QUALITY_REPORTS_DIR
 from utils.logger import setup_logger
@@ -14,12 +22,19 @@ from utils.logger import setup_logger
 logger = setup_logger(__name__)
 
 
+def _dumps_compact(obj) -> bytes:
+    # The batch JSON is machine-read; the Markdown summary is for people
+    if _USE_ORJSON:
+        return _json_impl.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
 def main():
     logger.info("=" * 60)
     logger.info("DonutAI - Data Quality Report Generator")
     logger.info("=" * 60)
     
-    dictionary = DataDictionary()
+    dictionary = get_data_dictionary()
     reporter = DataQualityReporter(dictionary)
     
     labeled_files = list(LABELED_DATA_DIR.glob("*.json"))
@@ -35,11 +50,11 @@ def main():
     
     reports_generated = 0
     all_data = []
+    all_reports = []
     
     for file_path in labeled_files:
         try:
-            with open(file_path, "r") as f:
-                data = json.load(f)
+            data = _json_impl.loads(file_path.read_bytes())
             
             if isinstance(data, list):
                 records = data
@@ -47,12 +62,9 @@ def main():
                 records = [data]
             
             for record in records:
-                all_data.append(record)
                 report = reporter.generate_report(record, report_type="full")
-                
-                reporter.save_report(report, format="json")
-                reporter.save_report(report, format="markdown")
-                
+                all_data.append(record)
+                all_reports.append(report)
                 reports_generated += 1
                 
                 symbol = record.get('symbol', 'unknown')
@@ -70,17 +82,21 @@ def main():
             print(f"  ❌ Error processing {file_path.name}: {e}")
     
     if reports_generated > 0:
+        # One JSON Lines file and one Markdown file for the whole run
+        # instead of two files per record
+        reports_jsonl_path = reporter.save_reports(all_reports, format="jsonl")
+        reporter.save_reports(all_reports, output_path=reports_jsonl_path.with_suffix(".md"), format="markdown")
+        
         logger.info("\nGenerating batch summary report...")
         print("\n📈 Generating batch summary report...")
         
-        batch_report = reporter.generate_batch_report(all_data)
+        batch_report = reporter.generate_batch_report(all_data, reports=all_reports)
         
         timestamp = batch_report['report_metadata']['generated_at'].replace(':', '-').split('.')[0]
         batch_json_path = QUALITY_REPORTS_DIR / f"batch_summary_{timestamp}.json"
         batch_md_path = QUALITY_REPORTS_DIR / f"batch_summary_{timestamp}.md"
         
-        with open(batch_json_path, "w") as f:
-            json.dump(batch_report, f, indent=2)
+        batch_json_path.write_bytes(_dumps_compact(batch_report))
         
         md_lines = [
             "# Batch Quality Summary Report",
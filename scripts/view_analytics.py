@@ -5,94 +5,93 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from analytics.metrics_calculator import MetricsCalculator
 from datetime import date, timedelta
 import json
 
 
 def main():
-    print("=" * 60)
-    print("DonutAI Product Analytics Dashboard")
-    print("=" * 60)
+    # Imported here so loading this module doesn't pull in SQLAlchemy/pandas
+    from analytics.metrics_calculator import MetricsCalculator
     
     calculator = MetricsCalculator()
     
     try:
-        print("\n📊 DAU (Daily Active Users)")
-        print("-" * 60)
-        current_dau = calculator.calculate_dau()
-        print(f"Today's DAU: {current_dau}")
-        
-        dau_timeseries = calculator.get_dau_timeseries(7)
-        print("\nLast 7 days:")
-        for day in dau_timeseries:
-            print(f"  {day['date']}: {day['dau']} active sessions")
-        
-        print("\n📈 Conversion Rates (Last 30 days)")
-        print("-" * 60)
-        
-        end_date = date.today()
-        start_date = end_date - timedelta(days=30)
-        date_range = (start_date, end_date)
-        
-        pipeline_completion = calculator.calculate_conversion_rate(
-            'pipeline_start', 'evaluation_complete', date_range
-        )
-        collection_to_cleaning = calculator.calculate_conversion_rate(
-            'collection_complete', 'cleaning_complete', date_range
+        # Every metric below comes from one session and a handful of
+        # grouped queries instead of one query per number
+        bundle = calculator.get_dashboard_bundle(
+            days=30,
+            timeseries_days=7,
+            cohort_date=date.today() - timedelta(days=7),
+            retention_days=[1, 7, 30]
         )
-        cleaning_to_labeling = calculator.calculate_conversion_rate(
-            'cleaning_complete', 'labeling_complete', date_range
-        )
-        labeling_to_evaluation = calculator.calculate_conversion_rate(
-            'labeling_complete', 'evaluation_complete', date_range
-        )
-        
-        print(f"Pipeline Start → Evaluation Complete: {pipeline_completion}%")
-        print(f"Collection → Cleaning: {collection_to_cleaning}%")
-        print(f"Cleaning → Labeling: {cleaning_to_labeling}%")
-        print(f"Labeling → Evaluation: {labeling_to_evaluation}%")
-        
-        print("\n🔄 Pipeline Funnel (Last 30 days)")
-        print("-" * 60)
-        
-        funnel = calculator.get_pipeline_funnel(30)
-        for step, data in funnel.items():
-            print(f"\n{step}:")
-            print(f"  Users reached: {data['users_reached']}")
-            print(f"  Conversion rate: {data['conversion_rate']}%")
-            if data['dropoff_rate'] > 0:
-                print(f"  Drop-off rate: {data['dropoff_rate']}%")
-        
-        print("\n⚙️  Feature Usage (Last 30 days)")
-        print("-" * 60)
-        
-        usage = calculator.get_feature_usage(30)
-        print(f"Total sessions: {usage['total_sessions']}")
-        print(f"Completed sessions: {usage['completed_sessions']}")
-        print(f"Completion rate: {usage['completion_rate']}%")
-        print(f"Average completion time: {usage['avg_completion_hours']:.2f} hours")
-        
-        print("\n🔁 Retention Rates")
-        print("-" * 60)
-        
-        cohort_date = date.today() - timedelta(days=7)
-        retention = calculator.calculate_retention(cohort_date, [1, 7, 30])
-        
-        print(f"Cohort from {cohort_date.isoformat()}:")
-        print(f"  Day 1 retention: {retention.get('day_1', 0)}%")
-        print(f"  Day 7 retention: {retention.get('day_7', 0)}%")
-        print(f"  Day 30 retention: {retention.get('day_30', 0)}%")
-        
-        print("\n📋 Complete Summary")
-        print("-" * 60)
-        
-        summary = calculator.get_summary(30)
-        print(json.dumps(summary, indent=2, default=str))
         
-        print("\n" + "=" * 60)
-        print("Analytics complete!")
-        print("=" * 60)
+        # The dashboard is assembled first and written with a single print
+        lines = [
+            "=" * 60,
+            "DonutAI Product Analytics Dashboard",
+            "=" * 60,
+        ]
+        
+        lines.append("\n📊 DAU (Daily Active Users)")
+        lines.append("-" * 60)
+        lines.append(f"Today's DAU: {bundle['dau']}")
+        
+        lines.append("\nLast 7 days:")
+        for day in bundle['dau_timeseries']:
+            lines.append(f"  {day['date']}: {day['dau']} active sessions")
+        
+        lines.append("\n📈 Conversion Rates (Last 30 days)")
+        lines.append("-" * 60)
+        
+        labels = {
+            ('pipeline_start', 'evaluation_complete'): "Pipeline Start → Evaluation Complete",
+            ('collection_complete', 'cleaning_complete'): "Collection → Cleaning",
+            ('cleaning_complete', 'labeling_complete'): "Cleaning → Labeling",
+            ('labeling_complete', 'evaluation_complete'): "Labeling → Evaluation"
+        }
+        for conversion in bundle['conversion_rates']:
+            label = labels[(conversion['start_event'], conversion['end_event'])]
+            lines.append(f"{label}: {conversion['rate']:.2f}%")
+        
+        lines.append("\n🔄 Pipeline Funnel (Last 30 days)")
+        lines.append("-" * 60)
+        
+        for step, data in bundle['pipeline_funnel'].items():
+            lines.append(f"\n{step}:")
+            lines.append(f"  Sessions reached: {data['count']}")
+            if data['conversion_rate'] is not None:
+                lines.append(f"  Conversion rate: {data['conversion_rate']:.2f}%")
+            if data['drop_off']:
+                lines.append(f"  Drop-off rate: {data['drop_off']:.2f}%")
+        
+        lines.append("\n⚙️  Feature Usage (Last 30 days)")
+        lines.append("-" * 60)
+        
+        usage = bundle['feature_usage']
+        lines.append(f"Total sessions: {usage['total_sessions']}")
+        lines.append(f"Completed sessions: {usage['completed_sessions']}")
+        lines.append(f"Completion rate: {usage['completion_rate']}%")
+        lines.append(f"Average completion time: {usage['avg_completion_hours']:.2f} hours")
+        
+        lines.append("\n🔁 Retention Rates")
+        lines.append("-" * 60)
+        
+        retention = bundle['retention']
+        lines.append(f"Cohort from {bundle['cohort_date'].isoformat()}:")
+        lines.append(f"  Day 1 retention: {retention.get(1, 0):.2f}%")
+        lines.append(f"  Day 7 retention: {retention.get(7, 0):.2f}%")
+        lines.append(f"  Day 30 retention: {retention.get(30, 0):.2f}%")
+        
+        lines.append("\n📋 Complete Summary")
+        lines.append("-" * 60)
+        
+        lines.append(json.dumps(bundle, indent=2, default=str))
+        
+        lines.append("\n" + "=" * 60)
+        lines.append("Analytics complete!")
+        lines.append("=" * 60)
+        
+        print("\n".join(lines))
         
     finally:
         calculator.close()
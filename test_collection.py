@@ -1,4 +1,6 @@
 
+import time
+
 from core.data_collector import DataCollector
 from config.settings import FREECRYPTO_API_KEY, FREECRYPTO_API_BASE_URL
 from utils.logger import setup_logger
@@ -12,34 +14,31 @@ def test_single_coin():
     print("=" * 60)
     
     try:
-        collector = DataCollector(
+        with DataCollector(
             api_key=FREECRYPTO_API_KEY,
             base_url=FREECRYPTO_API_BASE_URL
-        )
-        
-        print("\nCollecting data for BTC...")
-        data = collector.collect_coin_data("BTC")
-        
-        if data:
-            print("\n✅ Success! Collected data:")
-            print(f"  Symbol: {data.get('symbol')}")
-            print(f"  Price: ${data.get('price', 'N/A')}")
-            print(f"  Timestamp: {data.get('timestamp')}")
-            print(f"  Market Cap: {data.get('market_cap', 'N/A')}")
-            print(f"  24h Volume: {data.get('volume_24h', 'N/A')}")
-            print(f"  24h Change: {data.get('price_change_24h', 'N/A')}%")
+        ) as collector:
+            print("\nCollecting data for BTC...")
+            data = collector.collect_coin_data("BTC")
             
-            print("\nTesting data saving...")
-            filepath = collector.save_data(data, format="json")
-            print(f"✅ Data saved to: {filepath}")
-        else:
-            print("\n❌ Failed to collect data. Check:")
-            print("  1. API key is correct")
-            print("  2. Internet connection")
-            print("  3. API endpoint is correct")
-            print("  4. Check logs for detailed error messages")
-        
-        collector.close()
+            if data:
+                print("\n✅ Success! Collected data:")
+                print(f"  Symbol: {data.get('symbol')}")
+                print(f"  Price: ${data.get('price', 'N/A')}")
+                print(f"  Timestamp: {data.get('timestamp')}")
+                print(f"  Market Cap: {data.get('market_cap', 'N/A')}")
+                print(f"  24h Volume: {data.get('volume_24h', 'N/A')}")
+                print(f"  24h Change: {data.get('price_change_24h', 'N/A')}%")
+                
+                print("\nTesting data saving...")
+                filepath = collector.save_data(data, format="json")
+                print(f"✅ Data saved to: {filepath}")
+            else:
+                print("\n❌ Failed to collect data. Check:")
+                print("  1. API key is correct")
+                print("  2. Internet connection")
+                print("  3. API endpoint is correct")
+                print("  4. Check logs for detailed error messages")
         
     except Exception as e:
         print(f"\n❌ Error: {e}")
@@ -49,8 +48,34 @@ def test_single_coin():
     return True
 
 
+def check_multiple_coins(symbols=("BTC", "ETH", "SOL")):
+    print("=" * 60)
+    print(f"Testing Data Collection - Multiple Coins ({', '.join(symbols)})")
+    print("=" * 60)
+    
+    try:
+        with DataCollector(
+            api_key=FREECRYPTO_API_KEY,
+            base_url=FREECRYPTO_API_BASE_URL
+        ) as collector:
+            start = time.perf_counter()
+            results = collector.collect_multiple_coins(list(symbols))
+            elapsed = time.perf_counter() - start
+            
+            print(f"\nCollected {len(results)}/{len(symbols)} coins in {elapsed:.1f}s")
+            for data in results:
+                print(f"  {data.get('symbol')}: ${data.get('price', 'N/A')}")
+        
+    except Exception as e:
+        print(f"\n❌ Error: {e}")
+        logger.exception("Test failed with exception")
+        return False
+    
+    return bool(results)
+
+
 if __name__ == "__main__":
-    success = test_single_coin()
+    success = test_single_coin() and check_multiple_coins()
     if success:
         print("\n" + "=" * 60)
         print("✅ Test completed successfully!")
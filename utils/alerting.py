@@ -1,16 +1,45 @@
 
-import json
-from typing import Dict, Any, Optional
+import logging
+from typing import Dict, Any, List, Optional
 from utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+_EQ = "=" * 60
+_DASH = "-" * 60
+
+# Fixed lines shared by every alert; only the timestamp varies
+_ACTION_REQUIRED_LINES = (
+    _EQ,
+    "ACTION REQUIRED:",
+    "- Please investigate the quality score drop",
+    "- Check logs for errors in data collection/cleaning/labeling",
+    "- Verify data sources are functioning correctly",
+)
+_SUMMARY_HEADER_LINES = ("🔍 ANOMALY CHECK SUMMARY", _EQ, "")
+
+_SEVERITY_EMOJI = {'high': '🔴', 'medium': '🟡', 'low': '🟢'}
+_SEVERITY_LOG_LEVEL = {'high': logging.ERROR, 'medium': logging.WARNING}
+
 
 class AlertManager:
     
     def __init__(self, alert_channels: Optional[list] = None):
         self.alert_channels = alert_channels or ['console']
-        logger.info(f"AlertManager initialized with channels: {self.alert_channels}")
+        
+        self._dispatch = {
+            'console': self._send_console_alert,
+            'email': self._send_email,
+            'slack': self._send_slack,
+            'webhook': self._send_webhook
+        }
+        unknown = [ch for ch in self.alert_channels if ch not in self._dispatch]
+        if unknown:
+            raise ValueError(f"Unknown alert channels: {unknown}. Choose from {list(self._dispatch)}")
+        # Resolved once; the configured channels don't change per alert
+        self._default_handlers = [(ch, self._dispatch[ch]) for ch in self.alert_channels]
+        
+        logger.info("AlertManager initialized with channels: %s", self.alert_channels)
     
     def send_anomaly_alert(
         self, 
@@ -20,82 +49,99 @@ class AlertManager:
         if not anomaly_result.get('anomaly_detected'):
             return False
         
-        message = self._format_alert_message(anomaly_result)
+        if channel:
+            handler = self._dispatch.get(channel)
+            if handler is None:
+                logger.warning("Unknown alert channel: %s", channel)
+                return False
+            handlers = [(channel, handler)]
+        else:
+            handlers = self._default_handlers
         
-        channels = [channel] if channel else self.alert_channels
+        # Console alerts are just log records; when the logger would drop
+        # this one, skip building the message at all
+        severity = anomaly_result.get('overall_severity', 'medium')
+        if all(ch == 'console' for ch, _ in handlers) and not logger.isEnabledFor(
+            _SEVERITY_LOG_LEVEL.get(severity, logging.INFO)
+        ):
+            return True
+        
+        message = self._format_alert_message(anomaly_result)
         
         success = True
-        for ch in channels:
+        for ch, handler in handlers:
             try:
-                if ch == 'console':
-                    self._send_console_alert(message, anomaly_result)
-                elif ch == 'email':
-                    self._send_email(message, anomaly_result)
-                elif ch == 'slack':
-                    self._send_slack(message, anomaly_result)
-                elif ch == 'webhook':
-                    self._send_webhook(message, anomaly_result)
-                else:
-                    logger.warning(f"Unknown alert channel: {ch}")
-                    success = False
+                handler(message, anomaly_result)
             except Exception as e:
-                logger.error(f"Error sending alert via {ch}: {e}", exc_info=True)
+                logger.error("Error sending alert via %s: %s", ch, e, exc_info=True)
                 success = False
         
         return success
     
+    def send_anomaly_alerts(self, anomaly_results: List[Dict[str, Any]]) -> int:
+        # Batch entry point for a whole check: results without an anomaly are
+        # dropped up front; returns how many alerts were sent successfully
+        sent = 0
+        for anomaly_result in anomaly_results:
+            if anomaly_result.get('anomaly_detected') and self.send_anomaly_alert(anomaly_result):
+                sent += 1
+        return sent
+    
     def _format_alert_message(self, anomaly_result: Dict[str, Any]) -> str:
         agent_type = anomaly_result.get('agent_type', 'unknown')
         anomalies = anomaly_result.get('anomalies', [])
         severity = anomaly_result.get('overall_severity', 'medium')
         
-        severity_emoji = {'high': '🔴', 'medium': '🟡', 'low': '🟢'}.get(severity, '⚪')
-        msg = f"{severity_emoji} ANOMALY ALERT: {agent_type.upper()} Metrics\n"
-        msg += "=" * 60 + "\n\n"
-        
+        severity_emoji = _SEVERITY_EMOJI.get(severity, '⚪')
         latest_score = anomaly_result.get('latest_score')
         historical_avg = anomaly_result.get('historical_avg')
-        msg += f"Current Quality Score: {latest_score:.3f}\n"
-        msg += f"Historical Average: {historical_avg:.3f}\n"
-        msg += f"Severity: {severity.upper()}\n\n"
-        
-        msg += "Anomalies Detected:\n"
-        msg += "-" * 60 + "\n"
+        timestamp = anomaly_result.get('timestamp', 'N/A')
+        
+        # Lines are collected and joined once rather than concatenated
+        parts = [
+            f"{severity_emoji} ANOMALY ALERT: {agent_type.upper()} Metrics",
+            _EQ,
+            "",
+            f"Current Quality Score: {latest_score:.3f}",
+            f"Historical Average: {historical_avg:.3f}",
+            f"Severity: {severity.upper()}",
+            "",
+            "Anomalies Detected:",
+            _DASH,
+        ]
+        
+        # One entry per anomaly, its trailing blank line included
+        append = parts.append
         for i, anomaly in enumerate(anomalies, 1):
-            msg += f"{i}. [{anomaly['type'].upper()}] {anomaly['severity'].upper()}\n"
-            msg += f"   {anomaly['message']}\n"
-            if 'current_value' in anomaly and 'threshold' in anomaly:
-                msg += f"   Value: {anomaly['current_value']:.3f} | Threshold: {anomaly['threshold']:.3f}\n"
-            msg += "\n"
-        
-        msg += "=" * 60 + "\n"
-        msg += "ACTION REQUIRED:\n"
-        msg += "- Please investigate the quality score drop\n"
-        msg += "- Check logs for errors in data collection/cleaning/labeling\n"
-        msg += "- Verify data sources are functioning correctly\n"
-        msg += f"- Timestamp: {anomaly_result.get('timestamp', 'N/A')}\n"
-        msg += "=" * 60
-        
-        return msg
+            entry = (
+                f"{i}. [{anomaly['type'].upper()}] {anomaly['severity'].upper()}\n"
+                f"   {anomaly['message']}\n"
+            )
+            current_value = anomaly.get('current_value')
+            threshold = anomaly.get('threshold')
+            if current_value is not None and threshold is not None:
+                entry += f"   Value: {current_value:.3f} | Threshold: {threshold:.3f}\n"
+            append(entry)
+        
+        parts.extend(_ACTION_REQUIRED_LINES)
+        append(f"- Timestamp: {timestamp}")
+        append(_EQ)
+        
+        return "\n".join(parts)
     
     def _send_console_alert(self, message: str, anomaly_result: Dict[str, Any]):
         severity = anomaly_result.get('overall_severity', 'medium')
         
-        if severity == 'high':
-            logger.error(f"\n{message}\n")
-        elif severity == 'medium':
-            logger.warning(f"\n{message}\n")
-        else:
-            logger.info(f"\n{message}\n")
+        logger.log(_SEVERITY_LOG_LEVEL.get(severity, logging.INFO), "\n%s\n", message)
     
     def _send_email(self, message: str, anomaly_result: Dict[str, Any]):
-        logger.info(f"Email alert (not implemented): {message[:100]}...")
+        logger.info("Email alert (not implemented): %.100s...", message)
     
     def _send_slack(self, message: str, anomaly_result: Dict[str, Any]):
-        logger.info(f"Slack alert (not implemented): {message[:100]}...")
+        logger.info("Slack alert (not implemented): %.100s...", message)
     
     def _send_webhook(self, message: str, anomaly_result: Dict[str, Any]):
-        logger.info(f"Webhook alert (not implemented): {message[:100]}...")
+        logger.info("Webhook alert (not implemented): %.100s...", message)
     
     def send_summary_alert(self, check_results: Dict[str, Any]) -> bool:
         anomalies_found = check_results.get('anomalies_found', 0)
@@ -105,31 +151,37 @@ class AlertManager:
             logger.info("✅ No anomalies detected - all metrics are healthy")
             return True
         
-        msg = f"🔍 ANOMALY CHECK SUMMARY\n"
-        msg += "=" * 60 + "\n\n"
-        msg += f"Total Anomalies Found: {anomalies_found}\n"
-        msg += f"Critical Anomalies: {critical_anomalies}\n\n"
+        # anomalies_found > 0 here, so the summary is at least a warning
+        summary_severity = 'high' if critical_anomalies > 0 else 'medium'
+        level = _SEVERITY_LOG_LEVEL[summary_severity]
+        if not logger.isEnabledFor(level):
+            return True
+        
+        parts = [
+            *_SUMMARY_HEADER_LINES,
+            f"Total Anomalies Found: {anomalies_found}",
+            f"Critical Anomalies: {critical_anomalies}",
+            "",
+        ]
         
         for agent_check in check_results.get('agents_checked', []):
             agent_type = agent_check.get('agent_type')
+            score = agent_check.get('latest_score', 'N/A')
             if agent_check.get('anomaly_detected'):
                 severity = agent_check.get('severity', 'medium')
                 count = agent_check.get('anomaly_count', 0)
-                score = agent_check.get('latest_score', 'N/A')
-                msg += f"  🔴 {agent_type}: {count} anomaly(ies) - Severity: {severity} - Score: {score}\n"
+                parts.append(f"  🔴 {agent_type}: {count} anomaly(ies) - Severity: {severity} - Score: {score}")
             else:
-                score = agent_check.get('latest_score', 'N/A')
-                msg += f"  ✅ {agent_type}: No anomalies - Score: {score}\n"
+                parts.append(f"  ✅ {agent_type}: No anomalies - Score: {score}")
         
-        msg += f"\nTimestamp: {check_results.get('timestamp')}\n"
-        msg += "=" * 60
+        parts.extend([
+            "",
+            f"Timestamp: {check_results.get('timestamp')}",
+            _EQ,
+        ])
+        msg = "\n".join(parts)
         
-        if critical_anomalies > 0:
-            logger.error(f"\n{msg}\n")
-        elif anomalies_found > 0:
-            logger.warning(f"\n{msg}\n")
-        else:
-            logger.info(f"\n{msg}\n")
+        logger.log(level, "\n%s\n", msg)
         
         return True
 
@@ -1,9 +1,50 @@
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from pathlib import Path
 from datetime import datetime
 
+# Shared by every handler this module creates
+_FORMATTER = logging.Formatter(
+    '[%(asctime)s] [%(levelname)s] [%(name)s] - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+DEFAULT_LOG_FILE = "logs/donutai.log"
+
+_listener = None
+
+# One handler per stream/file and level, shared by every logger that asks
+_console_handlers = {}
+_file_handlers = {}
+
+
+def _console_handler(level: int) -> logging.Handler:
+    handler = _console_handlers.get(level)
+    if handler is None:
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setLevel(level)
+        handler.setFormatter(_FORMATTER)
+        _console_handlers[level] = handler
+    return handler
+
+
+def _file_handler(log_file, level: int) -> logging.Handler:
+    log_path = Path(log_file).resolve()
+    key = (log_path, level)
+    handler = _file_handlers.get(key)
+    if handler is None:
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        handler = logging.FileHandler(log_path)
+        handler.setLevel(level)
+        handler.setFormatter(_FORMATTER)
+        _file_handlers[key] = handler
+    return handler
+
+
 def setup_logger(name: str, log_file: str = None, level: int = logging.INFO) -> logging.Logger:
     logger = logging.getLogger(name)
     logger.setLevel(level)
@@ -11,29 +52,29 @@ def setup_logger(name: str, log_file: str = None, level: int = logging.INFO) ->
     if logger.handlers:
         return logger
     
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(level)
-    
-    formatter = logging.Formatter(
-        '[%(asctime)s] [%(levelname)s] [%(name)s] - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    logger.addHandler(_console_handler(level))
     
     if log_file:
-        log_path = Path(log_file)
-        log_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        file_handler = logging.FileHandler(log_file)
-        file_handler.setLevel(level)
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        logger.addHandler(_file_handler(log_file, level))
     
     return logger
 
-default_logger = setup_logger(
-    "DonutAI",
-    log_file="logs/donutai.log"
-)
 
+def configure_logging(log_file: str = DEFAULT_LOG_FILE, level: int = logging.INFO):
+    # Called once by the entry points. Records from every module logger
+    # propagate to the root, where a QueueHandler hands them to a background
+    # listener that owns the log file, so file writes leave the caller's thread.
+    global _listener
+    if _listener is not None:
+        return
+    
+    file_handler = _file_handler(log_file, level)
+    
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setLevel(level)
+    logging.getLogger().addHandler(queue_handler)
+    
+    _listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)  # Flushes queued records on exit
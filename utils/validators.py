@@ -2,6 +2,8 @@
 from typing import Any, Dict, List, Optional
 import pandas as pd
 
+_MISSING = object()
+
 def validate_api_response(response_data: Dict[str, Any]) -> bool:
     if not isinstance(response_data, dict):
         return False
@@ -19,19 +21,22 @@ def validate_api_response(response_data: Dict[str, Any]) -> bool:
     return False
 
 def validate_crypto_data(data: Dict[str, Any]) -> tuple[bool, Optional[str]]:
-    required_fields = ["symbol", "price"]
+    # Straight-line checks; each field is looked up once
+    symbol = data.get("symbol", _MISSING)
+    if symbol is _MISSING:
+        return False, "Missing required field: symbol"
     
-    for field in required_fields:
-        if field not in data:
-            return False, f"Missing required field: {field}"
+    price = data.get("price", _MISSING)
+    if price is _MISSING:
+        return False, "Missing required field: price"
     
-    if not isinstance(data["symbol"], str):
+    if not isinstance(symbol, str):
         return False, "Symbol must be a string"
     
-    if not isinstance(data["price"], (int, float)):
+    if not isinstance(price, (int, float)):
         return False, "Price must be a number"
     
-    if data["price"] <= 0:
+    if price <= 0:
         return False, "Price must be positive"
     
     return True, None
@@ -40,7 +45,9 @@ def validate_dataframe(df: pd.DataFrame, required_columns: List[str]) -> tuple[b
     if df.empty:
         return False, "DataFrame is empty"
     
-    missing_columns = set(required_columns) - set(df.columns)
+    # Index membership is hash-backed; no sets need building per call
+    columns = df.columns
+    missing_columns = [col for col in required_columns if col not in columns]
     if missing_columns:
         return False, f"Missing required columns: {missing_columns}"
     